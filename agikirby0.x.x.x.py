@@ -6,6 +6,8 @@
 # ============================================================
 
 import pygame, numpy as np, math, random, sys, asyncio, platform
+import pygame.freetype
+from collections import defaultdict
 from enum import Enum
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
@@ -25,6 +27,11 @@ screen = pygame.display.set_mode((W, H))
 pygame.display.set_caption("Kirby's Adventure Style Engine - HAL Lab Tweening")
 clock = pygame.time.Clock()
 
+# Only QUIT and KEYDOWN are ever handled; block everything else at the
+# SDL level so unretrieved events can't fill up the queue
+pygame.event.set_blocked(None)
+pygame.event.set_allowed((pygame.QUIT, pygame.KEYDOWN))
+
 # ============================================================
 # Enhanced Color Palette (Kirby's Adventure Style)
 # ============================================================
@@ -54,6 +61,10 @@ LEVEL_LEN = 3600
 font = pygame.font.Font(None, 18)
 big_font = pygame.font.Font(None, 32)
 ultra_font = pygame.font.Font(None, 48)
+# freetype font for the HUD: render_to draws straight onto the target
+# surface through a per-glyph cache, no throwaway surface per string
+# (size 13 matches the metrics of pygame.font size 18)
+ft_font = pygame.freetype.Font(None, 13)
 
 # ============================================================
 # HAL Lab Tweening System
@@ -174,67 +185,152 @@ ABILITY_COLORS = {
 # ============================================================
 # Particle System with HAL Lab Tweening
 # ============================================================
-class Particle:
-    def __init__(self, x, y, vx, vy, color, life=1.0, size=3, gravity=0, tween_type="smooth"):
-        self.x, self.y = x, y
-        self.vx, self.vy = vx, vy
-        self.color = color
-        self.life = life
-        self.max_life = life
-        self.size = size
-        self.gravity = gravity
-        self.tween_type = tween_type
-        self.start_size = size
-        self.rotation = random.uniform(0, math.pi * 2)
-        self.rotation_speed = random.uniform(-5, 5)
-    
+MAX_PARTICLES = 1024
+TWEEN_SMOOTH, TWEEN_BOUNCY, TWEEN_ELASTIC = 0, 1, 2
+_TWEEN_CODES = {"smooth": TWEEN_SMOOTH, "bouncy": TWEEN_BOUNCY,
+                "elastic": TWEEN_ELASTIC}
+
+def _bounce_out_np(t):
+    """Vectorized Tween.ease_out_bounce"""
+    t2 = t - 1.5 / 2.75
+    t3 = t - 2.25 / 2.75
+    t4 = t - 2.625 / 2.75
+    return np.select(
+        [t < 1 / 2.75, t < 2 / 2.75, t < 2.5 / 2.75],
+        [7.5625 * t * t, 7.5625 * t2 * t2 + 0.75, 7.5625 * t3 * t3 + 0.9375],
+        7.5625 * t4 * t4 + 0.984375)
+
+def _elastic_out_np(t):
+    """Vectorized Tween.ease_out_elastic"""
+    p = 0.3
+    out = np.power(2.0, -10.0 * t) * np.sin((t - p / 4) * (2 * np.pi) / p) + 1
+    return np.where(t <= 0, 0.0, np.where(t >= 1, 1.0, out))
+
+# Round particles blit a cached per-(color, radius) glow sprite instead
+# of rasterizing a circle per particle per frame
+_GLOW_CACHE = {}
+
+def _glow_surf(color, r):
+    key = (color, r)
+    s = _GLOW_CACHE.get(key)
+    if s is None:
+        s = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+        pygame.draw.circle(s, color, (r, r), r)
+        s = _GLOW_CACHE[key] = s.convert_alpha()
+    return s
+
+class ParticleSystem:
+    """Structure-of-arrays particle store: one NumPy array per field so a
+    frame's worth of motion/tweening is a handful of vector ops instead of
+    per-particle Python method dispatch. Slots are a ring buffer; the
+    oldest particle is overwritten when the pool wraps."""
+
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.start_size = np.zeros(capacity, dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.rotation = np.zeros(capacity, dtype=np.float32)
+        self.rotation_speed = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.tween = np.zeros(capacity, dtype=np.int8)
+        self.is_star = np.zeros(capacity, dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self._cursor = 0
+
+    def __len__(self):
+        return int(self.alive.sum())
+
+    def clear(self):
+        self.alive[:] = False
+
+    def emit(self, x, y, vx, vy, color, life=1.0, size=3, gravity=0,
+             tween_type="smooth"):
+        i = self._cursor
+        self._cursor = (i + 1) % self.capacity
+        self.x[i], self.y[i] = x, y
+        self.vx[i], self.vy[i] = vx, vy
+        self.life[i] = self.max_life[i] = life
+        self.size[i] = self.start_size[i] = size
+        self.gravity[i] = gravity
+        self.rotation[i] = random.uniform(0, math.pi * 2)
+        self.rotation_speed[i] = random.uniform(-5, 5)
+        self.color[i] = color[:3]
+        self.tween[i] = _TWEEN_CODES.get(tween_type, TWEEN_SMOOTH)
+        self.is_star[i] = tuple(color[:3]) == STAR_YELLOW
+        self.alive[i] = True
+
     def update(self, dt):
+        alive = self.alive
+        if not alive.any():
+            return
         self.x += self.vx * dt
         self.y += self.vy * dt
         self.vy += self.gravity * dt
         self.life -= dt
         self.rotation += self.rotation_speed * dt
-        
-        # Apply tweening to size
-        t = 1 - (self.life / self.max_life)
-        if self.tween_type == "bouncy":
-            self.size = self.start_size * (1 - Tween.ease_out_bounce(t) * 0.8)
-        elif self.tween_type == "elastic":
-            self.size = self.start_size * (1 - Tween.ease_out_elastic(t) * 0.5)
-        else:
-            self.size = self.start_size * (1 - t * 0.8)
-        
-        return self.life > 0
-    
+        np.logical_and(alive, self.life > 0, out=alive)
+
+        # Apply tweening to sizes
+        t = 1.0 - self.life / self.max_life
+        np.clip(t, 0.0, 1.0, out=t)
+        size = self.start_size * (1.0 - t * 0.8)
+        m = alive & (self.tween == TWEEN_BOUNCY)
+        if m.any():
+            size[m] = self.start_size[m] * (1.0 - _bounce_out_np(t[m]) * 0.8)
+        m = alive & (self.tween == TWEEN_ELASTIC)
+        if m.any():
+            size[m] = self.start_size[m] * (1.0 - _elastic_out_np(t[m]) * 0.5)
+        self.size = size
+
     def draw(self, surf, camx):
-        if self.size > 0:
-            # Apply rotation to create spinning effect
-            sx = int(self.x - camx)
-            sy = int(self.y)
-            
-            # Draw with rotation for star particles
-            if self.color == STAR_YELLOW:
+        # Skip particles outside the camera view entirely
+        visible = self.alive & (self.x >= camx - 64) & (self.x <= camx + W + 64)
+        idx = np.nonzero(visible)[0]
+        if idx.size == 0:
+            return
+        # Screen-space transform for the whole batch at once
+        sx = (self.x[idx] - camx).astype(np.int32)
+        sy = self.y[idx].astype(np.int32)
+        sizes = self.size[idx]
+        blit = surf.blit
+        blend_add = pygame.BLEND_ADD
+        polygon = pygame.draw.polygon
+        cos, sin = math.cos, math.sin
+        for k, i in enumerate(idx):
+            size = sizes[k]
+            if size <= 0:
+                continue
+            color = self.color[i]
+            if self.is_star[i]:
+                # Draw with rotation for star particles
+                cx, cy = sx[k], sy[k]
+                rot = self.rotation[i]
                 points = []
-                for i in range(10):
-                    angle = math.pi * i / 5 + self.rotation
-                    if i % 2 == 0:
-                        r = self.size
-                    else:
-                        r = self.size * 0.5
-                    px = sx + r * math.cos(angle)
-                    py = sy + r * math.sin(angle)
-                    points.append((px, py))
-                pygame.draw.polygon(surf, self.color, points)
+                for j in range(10):
+                    angle = math.pi * j / 5 + rot
+                    r = size if j % 2 == 0 else size * 0.5
+                    points.append((cx + r * cos(angle), cy + r * sin(angle)))
+                polygon(surf, color, points)
             else:
-                pygame.draw.circle(surf, self.color, (sx, sy), int(self.size))
+                r = int(size)
+                if r > 0:
+                    blit(_glow_surf((color[0], color[1], color[2]), r),
+                         (sx[k] - r, sy[k] - r), special_flags=blend_add)
 
-particles: List[Particle] = []
+particles = ParticleSystem()
 
 def create_explosion(x, y, color, count=20):
     for _ in range(count):
         angle = random.uniform(0, math.pi * 2)
         speed = random.uniform(50, 200)
-        particles.append(Particle(
+        particles.emit(
             x, y,
             math.cos(angle) * speed,
             math.sin(angle) * speed,
@@ -243,13 +339,13 @@ def create_explosion(x, y, color, count=20):
             size=random.randint(2, 6),
             gravity=200,
             tween_type="bouncy"
-        ))
+        )
 
 def create_star_particles(x, y):
     for _ in range(10):
         angle = random.uniform(0, math.pi * 2)
         speed = random.uniform(100, 300)
-        particles.append(Particle(
+        particles.emit(
             x, y,
             math.cos(angle) * speed,
             math.sin(angle) * speed - 100,
@@ -258,11 +354,11 @@ def create_star_particles(x, y):
             size=4,
             gravity=400,
             tween_type="elastic"
-        ))
+        )
 
 def create_walk_dust(x, y):
     for _ in range(3):
-        particles.append(Particle(
+        particles.emit(
             x + random.randint(-10, 10),
             y,
             random.randint(-20, 20),
@@ -272,7 +368,7 @@ def create_walk_dust(x, y):
             size=random.randint(2, 4),
             gravity=100,
             tween_type="smooth"
-        ))
+        )
 
 # ============================================================
 # Input System
@@ -484,7 +580,7 @@ class Kirby:
             
             # Create float particles
             if random.random() < 0.2:
-                particles.append(Particle(
+                particles.emit(
                     self.x + random.randint(-15, 15),
                     self.y + self.r,
                     random.randint(-30, 30),
@@ -493,7 +589,7 @@ class Kirby:
                     life=0.4,
                     size=3,
                     tween_type="elastic"
-                ))
+                )
         elif self.on_ground:
             self.float_timer = 0.0
         
@@ -518,7 +614,7 @@ class Kirby:
             # Create landing particles
             if abs(self.prev_y - self.y) > 50:
                 for _ in range(5):
-                    particles.append(Particle(
+                    particles.emit(
                         self.x + random.randint(-15, 15),
                         self.y,
                         random.randint(-50, 50),
@@ -528,7 +624,7 @@ class Kirby:
                         size=random.randint(2, 4),
                         gravity=100,
                         tween_type="bouncy"
-                    ))
+                    )
                 
                 # Squash and stretch for landing
                 self.target_squash_x = 1.3
@@ -587,7 +683,7 @@ class Kirby:
                 
             # Create inhale particles
             if random.random() < 0.3:
-                particles.append(Particle(
+                particles.emit(
                     self.x + (20 if self.facing_right else -20),
                     self.y,
                     (50 if self.facing_right else -50) + random.randint(-20, 20),
@@ -596,7 +692,7 @@ class Kirby:
                     life=0.3,
                     size=4,
                     tween_type="elastic"
-                ))
+                )
         else:
             self.target_mouth_openness = 0.0
             if self.inhaling and self.has_enemy:
@@ -664,14 +760,14 @@ class Kirby:
                 2, Ability.ICE
             ))
             for _ in range(5):
-                particles.append(Particle(
+                particles.emit(
                     self.x + (30 if self.facing_right else -30),
                     self.y + random.randint(-10, 10),
                     (100 if self.facing_right else -100) + random.randint(-30, 30),
                     random.randint(-30, 30),
                     ICE_BLUE, 0.5, 3,
                     tween_type="elastic"
-                ))
+                )
         
         elif self.ability == Ability.SPARK:
             if sounds["spark"]:
@@ -720,14 +816,14 @@ class Kirby:
                 2, Ability.BEAM
             ))
             for _ in range(3):
-                particles.append(Particle(
+                particles.emit(
                     self.x + (30 if self.facing_right else -30),
                     self.y,
                     (150 if self.facing_right else -150) + random.randint(-20, 20),
                     random.randint(-20, 20),
                     BEAM_PURPLE, 0.4, 4,
                     tween_type="elastic"
-                ))
+                )
         
         elif self.ability == Ability.TORNADO:
             if sounds["tornado"]:
@@ -736,14 +832,14 @@ class Kirby:
             self.vx = 400 if self.facing_right else -400
             for i in range(8):
                 angle = i * math.pi / 4
-                particles.append(Particle(
+                particles.emit(
                     self.x + math.cos(angle) * 30,
                     self.y + math.sin(angle) * 30,
                     math.cos(angle) * 100,
                     math.sin(angle) * 100,
                     TORNADO_GREEN, 0.6, 5,
                     tween_type="bouncy"
-                ))
+                )
     
     def take_damage(self):
         if self.invuln_time <= 0:
@@ -1065,14 +1161,14 @@ class FireEnemy(Enemy):
         
         # Create flame particles
         if random.random() < 0.3:
-            particles.append(Particle(
+            particles.emit(
                 self.x + random.randint(-10, 10),
                 self.y - 10,
                 random.randint(-20, 20),
                 random.randint(-50, -20),
                 FIRE_ORANGE, 0.5, 4,
                 tween_type="bouncy"
-            ))
+            )
     
     def draw(self, surf, camx):
         if self.dead:
@@ -1130,14 +1226,14 @@ class IceEnemy(Enemy):
         
         # Create ice particles
         if random.random() < 0.2:
-            particles.append(Particle(
+            particles.emit(
                 self.x + random.randint(-15, 15),
                 self.y - 15,
                 random.randint(-10, 10),
                 random.randint(-10, 0),
                 ICE_BLUE, 0.4, 3,
                 tween_type="elastic"
-            ))
+            )
     
     def draw(self, surf, camx):
         if self.dead:
@@ -1197,14 +1293,14 @@ class SparkEnemy(Enemy):
         
         # Create spark particles
         if random.random() < 0.4:
-            particles.append(Particle(
+            particles.emit(
                 self.x + random.randint(-15, 15),
                 self.y + random.randint(-15, 15),
                 random.randint(-30, 30),
                 random.randint(-30, 30),
                 SPARK_YELLOW, 0.3, 2,
                 tween_type="elastic"
-            ))
+            )
     
     def draw(self, surf, camx):
         if self.dead:
@@ -1432,14 +1528,14 @@ class WhispyWoods(Boss):
             
             # Create apple particles
             for _ in range(5):
-                particles.append(Particle(
+                particles.emit(
                     apple_x + random.randint(-10, 10),
                     self.y - 200,
                     random.randint(-20, 20),
                     random.randint(-20, 0),
                     (255, 0, 0), 0.5, 4,
                     tween_type="bouncy"
-                ))
+                )
             
             # Squash and stretch when dropping apples
             self.target_squash_x = 1.1
@@ -2152,14 +2248,14 @@ class ZeroTwo(Boss):
             
             # Blood particles
             for _ in range(3):
-                particles.append(Particle(
+                particles.emit(
                     self.x + random.randint(-20, 20),
                     self.y + 30,
                     random.randint(-20, 20),
                     random.randint(50, 100),
                     (150, 0, 0), 0.5, 4,
                     tween_type="bouncy"
-                ))
+                )
         
         # Crystal shards attack
         if self.attack_timer > 2.5:
@@ -2339,6 +2435,84 @@ LEVEL_DATA = {
     }
 }
 
+# ============================================================
+# Inhale Kernel (numba-accelerated when available)
+# ============================================================
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _inhale_step(ex, ey, px, py, inhale_range, pull, swallow_r):
+        """Pull candidate enemies toward the player in-place; returns a
+        mask of the ones close enough to swallow"""
+        n = ex.shape[0]
+        swallowed = np.zeros(n, dtype=np.bool_)
+        for i in range(n):
+            dx = px - ex[i]
+            dy = py - ey[i]
+            dist = (dx * dx + dy * dy) ** 0.5
+            if dist < inhale_range:
+                if dist > 0:
+                    ex[i] += dx / dist * pull
+                    ey[i] += dy / dist * pull
+                if dist < swallow_r:
+                    swallowed[i] = True
+        return swallowed
+else:
+    def _inhale_step(ex, ey, px, py, inhale_range, pull, swallow_r):
+        """Pull candidate enemies toward the player in-place; returns a
+        mask of the ones close enough to swallow"""
+        dx = px - ex
+        dy = py - ey
+        dist = np.hypot(dx, dy)
+        pullable = (dist < inhale_range) & (dist > 0)
+        ex[pullable] += dx[pullable] / dist[pullable] * pull
+        ey[pullable] += dy[pullable] / dist[pullable] * pull
+        return dist < swallow_r
+
+# ============================================================
+# Collision Broad Phase
+# ============================================================
+class SpatialHash:
+    """Uniform grid that buckets enemies by cell so collision tests only
+    look at nearby cells instead of scanning every enemy"""
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+
+    def rebuild(self, enemies):
+        cell = self.cell_size
+        cells = self.cells
+        cells.clear()
+        for enemy in enemies:
+            if enemy.dead:
+                continue
+            r = enemy.rect()
+            for cx in range(r.left // cell, r.right // cell + 1):
+                for cy in range(r.top // cell, r.bottom // cell + 1):
+                    cells[(cx, cy)].append(enemy)
+
+    def query(self, rect):
+        """Enemies whose cells overlap rect (an enemy spanning several
+        cells is reported once)"""
+        cell = self.cell_size
+        get = self.cells.get
+        seen = set()
+        found = []
+        for cx in range(rect.left // cell, rect.right // cell + 1):
+            for cy in range(rect.top // cell, rect.bottom // cell + 1):
+                for enemy in get((cx, cy), ()):
+                    eid = id(enemy)
+                    if eid not in seen:
+                        seen.add(eid)
+                        found.append(enemy)
+        return found
+
 # ============================================================
 # Game State
 # ============================================================
@@ -2350,6 +2524,7 @@ class GameState:
         self.lives = 3
         self.player = None
         self.enemies = []
+        self.enemy_hash = SpatialHash()
         self.boss = None
         self.camera_x = 0
         self.transition_timer = 0
@@ -2359,6 +2534,7 @@ class GameState:
         self.level = level_num
         self.player = Kirby()
         self.enemies = []
+        self.enemy_hash = SpatialHash()
         
         level_info = LEVEL_DATA.get(level_num, LEVEL_DATA[1])
         
@@ -2374,22 +2550,52 @@ class GameState:
         self.camera_x = 0
         
         # Clear projectiles and particles for new level
-        global projectiles, particles
+        global projectiles
         projectiles = []
-        particles = []
+        particles.clear()
 
 game = GameState()
 
 # ============================================================
 # Drawing Functions
 # ============================================================
+# Static text rendered once and reused — font.render allocates a fresh
+# surface every call, which dominates menu-state frame time
+TEXT_CACHE = {}
+
+def cached_text(key, fnt, text, color):
+    s = TEXT_CACHE.get(key)
+    if s is None:
+        s = TEXT_CACHE[key] = fnt.render(text, True, color)
+    return s
+
+# Full-screen dimmer for the pause state, built once instead of
+# allocating and refilling a W x H surface every paused frame
+PAUSE_OVERLAY = pygame.Surface((W, H))
+PAUSE_OVERLAY.set_alpha(128)
+PAUSE_OVERLAY.fill(BLACK)
+
+# Both cloud ellipses rasterized once; per frame the cached surface is
+# just scaled to the tween size and blitted
+CLOUD_SURF = pygame.Surface((110, 50), pygame.SRCALPHA)
+pygame.draw.ellipse(CLOUD_SURF, WHITE, (0, 10, 80, 40))
+pygame.draw.ellipse(CLOUD_SURF, WHITE, (30, 0, 60, 35))
+CLOUD_SURF = CLOUD_SURF.convert_alpha()
+
+# Gradient backgrounds are static per color pair, so build each one once
+# with NumPy and blit the cached surface every frame after that
+GRADIENT_CACHE = {}
+
 def draw_gradient_bg(surf, color1, color2):
-    for y in range(H):
-        ratio = y / H
-        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-        pygame.draw.line(surf, (r, g, b), (0, y), (W, y))
+    cached = GRADIENT_CACHE.get((color1, color2))
+    if cached is None:
+        cached = GRADIENT_CACHE[(color1, color2)] = pygame.Surface((W, H))
+        t = (np.arange(H, dtype=np.float32) / H)[:, None]
+        rows = (np.asarray(color1, dtype=np.float32) * (1 - t)
+                + np.asarray(color2, dtype=np.float32) * t).astype(np.uint8)
+        rgb = np.broadcast_to(rows[:, None, :], (H, W, 3))
+        pygame.surfarray.blit_array(cached, rgb.swapaxes(0, 1).copy())
+    surf.blit(cached, (0, 0))
 
 def draw_kirby_face(surf, x, y, size=15):
     """Draw a small Kirby face for the lives display"""
@@ -2430,26 +2636,21 @@ def draw_hud(surf):
     pygame.draw.rect(surf, WHITE, (0, 0, W, 60), 2)
     
     # Score
-    score_text = font.render(f"SCORE {game.score:06d}", True, WHITE)
-    surf.blit(score_text, (10, 10))
-    
+    ft_font.render_to(surf, (10, 10), f"SCORE {game.score:06d}", WHITE)
+
     # Lives as Kirby faces
-    lives_text = font.render("LIVES", True, WHITE)
-    surf.blit(lives_text, (10, 35))
+    ft_font.render_to(surf, (10, 35), "LIVES", WHITE)
     for i in range(game.lives):
         draw_kirby_face(surf, 70 + i * 35, 43, 12)
     
     # Star counter
-    stars_text = font.render("STARS", True, WHITE)
-    surf.blit(stars_text, (200, 10))
+    ft_font.render_to(surf, (200, 10), "STARS", WHITE)
     draw_star(surf, 250, 18, 8)
-    stars_count_text = font.render(f"X {game.score // 100}", True, WHITE)
-    surf.blit(stars_count_text, (265, 10))
+    ft_font.render_to(surf, (265, 10), f"X {game.score // 100}", WHITE)
     
     # HP bar (only show if not at max HP)
     if game.player.hp < game.player.max_hp:
-        hp_text = font.render("HP", True, WHITE)
-        surf.blit(hp_text, (200, 35))
+        ft_font.render_to(surf, (200, 35), "HP", WHITE)
         hp_width = 80
         hp_height = 10
         hp_x = 230
@@ -2512,8 +2713,7 @@ def draw_hud(surf):
                               0, math.pi, 2)
         
         # Ability name
-        ability_text = font.render(ability_name, True, WHITE)
-        surf.blit(ability_text, (360, 35))
+        ft_font.render_to(surf, (360, 35), ability_name, WHITE)
     
     # Boss HP
     if game.boss and game.boss.hp > 0:
@@ -2523,8 +2723,7 @@ def draw_hud(surf):
         
         # Boss name
         boss_name = game.boss.__class__.__name__
-        name_text = font.render(boss_name, True, WHITE)
-        surf.blit(name_text, (boss_hp_x, boss_hp_y - 15))
+        ft_font.render_to(surf, (boss_hp_x, boss_hp_y - 15), boss_name, WHITE)
         
         # HP bar background
         pygame.draw.rect(surf, BLACK, 
@@ -2540,21 +2739,182 @@ def draw_hud(surf):
                         (boss_hp_x, boss_hp_y, hp_fill, 10))
         
         # HP text
-        hp_text = font.render(f"{game.boss.hp}/{game.boss.max_hp}", True, WHITE)
-        surf.blit(hp_text, (boss_hp_x + boss_hp_width // 2 - 20, boss_hp_y - 2))
+        ft_font.render_to(surf, (boss_hp_x + boss_hp_width // 2 - 20, boss_hp_y - 2),
+                          f"{game.boss.hp}/{game.boss.max_hp}", WHITE)
+
+PHYSICS_DT = 1.0 / 60.0
+
+def update_physics(dt):
+    """Advance the playing state by one fixed simulation step"""
+    # Advance the key snapshots here, not in the render loop: a key edge
+    # must be seen by exactly one simulation step, and frames can run
+    # zero or several steps depending on the accumulator
+    inputs.update()
+
+    # Update camera shake
+    if game.camera_shake > 0:
+        game.camera_shake -= dt * 5
+    
+    # Bind the hot attributes once per step — the loops below do
+    # thousands of LOAD_ATTR chains otherwise
+    player = game.player
+    enemies = game.enemies
+
+    # Update player
+    player.update(dt)
+
+    # Update camera with smooth following
+    target_cam_x = player.x - W // 2
+    cam_speed = 0.1
+    game.camera_x += (target_cam_x - game.camera_x) * cam_speed
+    game.camera_x = max(0, min(LEVEL_LEN - W, game.camera_x))
+
+    # Update enemies
+    for enemy in enemies:
+        if not enemy.dead:
+            enemy.update(dt)
+
+    # Rebuild the broad-phase grid once per step; the player and
+    # each projectile then only test enemies in nearby cells
+    game.enemy_hash.rebuild(game.enemies)
+
+    # Player state is read all over the collision passes — build
+    # the rect once (rect() allocates) and hoist the hot attributes
+    player_rect = player.rect()
+    player_x, player_y = player.x, player.y
+    inhale_range = player.inhale_range
+
+    # Check collision with player
+    touching = [enemy for enemy in game.enemy_hash.query(player_rect)
+                if not enemy.dead and enemy.rect().colliderect(player_rect)]
+    if player.inhaling and player.ability == Ability.NONE:
+        if touching:
+            # Batch the pull geometry through the inhale kernel,
+            # then apply the Python side effects per swallowed enemy
+            ex = np.array([e.x for e in touching], dtype=np.float64)
+            ey = np.array([e.y for e in touching], dtype=np.float64)
+            swallowed = _inhale_step(ex, ey, player_x, player_y,
+                                     inhale_range, 300 * dt, 30.0)
+            for i, enemy in enumerate(touching):
+                enemy.x = ex[i]
+                enemy.y = ey[i]
+                if swallowed[i]:
+                    enemy.dead = True
+                    player.has_enemy = True
+                    player.stored_ability = enemy.ability
+                    game.score += 100
+                    create_star_particles(enemy.x, enemy.y)
+    else:
+        for enemy in touching:
+            # Take damage
+            player.take_damage()
+            # Add camera shake when hit
+            game.camera_shake = 5.0
+
+    # Update boss
+    if game.boss and game.boss.hp > 0:
+        game.boss.update(dt, player)
+        boss_rect = game.boss.rect()
+
+        # Check collision with boss
+        if boss_rect.colliderect(player_rect):
+            if player.invuln_time <= 0:
+                player.take_damage()
+                game.boss.take_damage(1)
+                game.score += 500
+                # Add camera shake when hit
+                game.camera_shake = 5.0
+        
+        # Boss defeated
+        if game.boss.hp <= 0:
+            game.score += 5000
+            create_explosion(game.boss.x, game.boss.y - 50, WHITE, 50)
+            if sounds["win"]:
+                sounds["win"].play()
+            
+            # Add camera shake for boss defeat
+            game.camera_shake = 10.0
+            
+            # Next level or victory
+            if game.level >= len(LEVEL_DATA):
+                game.state = "victory"
+            else:
+                game.level += 1
+                game.setup_level(game.level)
+
+    # Boss rect for the projectile pass, refreshed in case the
+    # boss was just replaced by a level transition
+    boss = game.boss
+    boss_rect = boss.rect() if boss and boss.hp > 0 else None
+
+    # Update projectiles
+    query = game.enemy_hash.query
+    for proj in projectiles:
+        proj.update(dt)
+        if proj.dead:
+            continue
+        proj_rect = proj.rect()
+
+        # Player projectiles hit enemies (broad phase first)
+        if proj.owner == "player":
+            for enemy in query(proj_rect):
+                if not enemy.dead and enemy.rect().colliderect(proj_rect):
+                    enemy.take_damage(proj.damage)
+                    if enemy.dead:
+                        game.score += 200
+                    proj.dead = True
+                    create_explosion(proj.x, proj.y, 
+                                  ABILITY_COLORS.get(proj.ability, WHITE), 8)
+                    break
+            
+            # Hit boss
+            if boss_rect is not None and boss.hp > 0:
+                if boss_rect.colliderect(proj_rect):
+                    boss.take_damage(proj.damage)
+                    game.score += 100
+                    proj.dead = True
+                    create_explosion(proj.x, proj.y, 
+                                  ABILITY_COLORS.get(proj.ability, WHITE), 12)
+        
+        # Enemy projectiles hit player
+        elif proj.owner == "boss":
+            if player_rect.colliderect(proj_rect):
+                player.take_damage()
+                proj.dead = True
+                create_explosion(proj.x, proj.y, WHITE, 8)
+                # Add camera shake when hit
+                game.camera_shake = 3.0
+    
+    # Compact dead projectiles and particles in one pass instead
+    # of per-item remove() scans over a copied list
+    projectiles[:] = [p for p in projectiles if not p.dead]
+
+    # Update particles (single vectorized pass)
+    particles.update(dt)
+    
+    # Check game over
+    if game.player.hp <= 0:
+        game.lives -= 1
+        if game.lives <= 0:
+            game.state = "game_over"
+        else:
+            # Respawn
+            game.setup_level(game.level)
 
 # ============================================================
 # Main Game Loop
 # ============================================================
 async def main():
-    global particles, projectiles
-    
+    global projectiles
+
     running = True
-    dt = 0
+    accumulator = 0.0
     
     while running:
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events — only QUIT and KEYDOWN are acted on, so don't
+        # materialize Python objects for mouse-motion spam etc.; held
+        # keys come from key.get_pressed() via inputs.update()
+        for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -2563,20 +2923,27 @@ async def main():
                         game.state = "paused"
                     elif game.state == "paused":
                         game.state = "playing"
+                elif event.key == pygame.K_p:
+                    if game.state == "playing":
+                        game.state = "paused"
         
-        inputs.update()
-        
+        # While playing, the key snapshots advance once per simulation
+        # step inside update_physics; updating them here too would eat
+        # just_pressed edges on frames that run zero steps
+        if game.state != "playing":
+            inputs.update()
+
         # Title screen
         if game.state == "title":
             draw_gradient_bg(screen, (50, 0, 100), (255, 100, 150))
             
             # Title with bounce animation
             title_bounce = math.sin(pygame.time.get_ticks() * 0.003) * 5
-            title_text = ultra_font.render("Kirby's Adventure", True, KIRBY_PINK)
+            title_text = cached_text("title", ultra_font, "Kirby's Adventure", KIRBY_PINK)
             title_rect = title_text.get_rect(center=(W//2, H//2 - 100 + title_bounce))
             screen.blit(title_text, title_rect)
-            
-            subtitle = big_font.render("HAL Lab Tweening Style", True, WHITE)
+
+            subtitle = cached_text("subtitle", big_font, "HAL Lab Tweening Style", WHITE)
             subtitle_rect = subtitle.get_rect(center=(W//2, H//2 - 50))
             screen.blit(subtitle, subtitle_rect)
             
@@ -2593,7 +2960,7 @@ async def main():
             
             y_offset = H//2 + 20
             for line in instructions:
-                text = font.render(line, True, WHITE)
+                text = cached_text(("title_instr", line), font, line, WHITE)
                 text_rect = text.get_rect(center=(W//2, y_offset))
                 screen.blit(text, text_rect)
                 y_offset += 25
@@ -2622,138 +2989,22 @@ async def main():
         
         # Main gameplay
         elif game.state == "playing":
-            dt = clock.tick(FPS) / 1000.0
-            dt = min(dt, 0.05)  # Cap dt to prevent physics issues
-            
-            # Update camera shake
-            if game.camera_shake > 0:
-                game.camera_shake -= dt * 5
-            
-            # Update player
-            game.player.update(dt)
-            
-            # Update camera with smooth following
-            target_cam_x = game.player.x - W // 2
-            cam_speed = 0.1
-            game.camera_x += (target_cam_x - game.camera_x) * cam_speed
-            game.camera_x = max(0, min(LEVEL_LEN - W, game.camera_x))
-            
-            # Update enemies
-            for enemy in game.enemies[:]:
-                if not enemy.dead:
-                    enemy.update(dt)
-                    
-                    # Check collision with player
-                    if enemy.rect().colliderect(game.player.rect()):
-                        if game.player.inhaling and game.player.ability == Ability.NONE:
-                            # Inhale enemy
-                            distance = math.hypot(enemy.x - game.player.x, 
-                                                enemy.y - game.player.y)
-                            if distance < game.player.inhale_range:
-                                # Pull enemy toward Kirby
-                                pull_speed = 300 * dt
-                                dx = game.player.x - enemy.x
-                                dy = game.player.y - enemy.y
-                                length = math.sqrt(dx*dx + dy*dy)
-                                if length > 0:
-                                    enemy.x += (dx / length) * pull_speed
-                                    enemy.y += (dy / length) * pull_speed
-                                
-                                # Swallow if close enough
-                                if distance < 30:
-                                    enemy.dead = True
-                                    game.player.has_enemy = True
-                                    game.player.stored_ability = enemy.ability
-                                    game.score += 100
-                                    create_star_particles(enemy.x, enemy.y)
-                        else:
-                            # Take damage
-                            game.player.take_damage()
-                            # Add camera shake when hit
-                            game.camera_shake = 5.0
-            
-            # Update boss
-            if game.boss and game.boss.hp > 0:
-                game.boss.update(dt, game.player)
-                
-                # Check collision with boss
-                if game.boss.rect().colliderect(game.player.rect()):
-                    if game.player.invuln_time <= 0:
-                        game.player.take_damage()
-                        game.boss.take_damage(1)
-                        game.score += 500
-                        # Add camera shake when hit
-                        game.camera_shake = 5.0
-                
-                # Boss defeated
-                if game.boss.hp <= 0:
-                    game.score += 5000
-                    create_explosion(game.boss.x, game.boss.y - 50, WHITE, 50)
-                    if sounds["win"]:
-                        sounds["win"].play()
-                    
-                    # Add camera shake for boss defeat
-                    game.camera_shake = 10.0
-                    
-                    # Next level or victory
-                    if game.level >= len(LEVEL_DATA):
-                        game.state = "victory"
-                    else:
-                        game.level += 1
-                        game.setup_level(game.level)
-            
-            # Update projectiles
-            for proj in projectiles[:]:
-                proj.update(dt)
-                if proj.dead:
-                    projectiles.remove(proj)
-                    continue
-                
-                # Player projectiles hit enemies
-                if proj.owner == "player":
-                    for enemy in game.enemies:
-                        if not enemy.dead and enemy.rect().colliderect(proj.rect()):
-                            enemy.take_damage(proj.damage)
-                            if enemy.dead:
-                                game.score += 200
-                            proj.dead = True
-                            create_explosion(proj.x, proj.y, 
-                                          ABILITY_COLORS.get(proj.ability, WHITE), 8)
-                            break
-                    
-                    # Hit boss
-                    if game.boss and game.boss.hp > 0:
-                        if game.boss.rect().colliderect(proj.rect()):
-                            game.boss.take_damage(proj.damage)
-                            game.score += 100
-                            proj.dead = True
-                            create_explosion(proj.x, proj.y, 
-                                          ABILITY_COLORS.get(proj.ability, WHITE), 12)
-                
-                # Enemy projectiles hit player
-                elif proj.owner == "boss":
-                    if game.player.rect().colliderect(proj.rect()):
-                        game.player.take_damage()
-                        proj.dead = True
-                        create_explosion(proj.x, proj.y, WHITE, 8)
-                        # Add camera shake when hit
-                        game.camera_shake = 3.0
-            
-            # Update particles
-            for particle in particles[:]:
-                if not particle.update(dt):
-                    particles.remove(particle)
-            
-            # Check game over
-            if game.player.hp <= 0:
-                game.lives -= 1
-                if game.lives <= 0:
-                    game.state = "game_over"
-                else:
-                    # Respawn
-                    game.setup_level(game.level)
+            frame_dt = clock.tick(FPS) / 1000.0
+            frame_dt = min(frame_dt, 0.25)  # clamp after stalls
+            accumulator += frame_dt
+
+            # Fixed-timestep loop: simulation always advances in
+            # PHYSICS_DT steps regardless of the render rate
+            while accumulator >= PHYSICS_DT and game.state == "playing":
+                update_physics(PHYSICS_DT)
+                accumulator -= PHYSICS_DT
+
             
-            # Draw everything
+            # Draw everything — rebind the locals first since a level
+            # transition or respawn above swaps player/enemies/camera
+            player = game.player
+            enemies = game.enemies
+            camera_x = game.camera_x
             level_info = LEVEL_DATA.get(game.level, LEVEL_DATA[1])
             draw_gradient_bg(screen, level_info["bg_color"], GRASS_GREEN)
             
@@ -2772,34 +3023,37 @@ async def main():
             pygame.draw.rect(game_surface, GRASS_GREEN, 
                            (0, FLOOR_Y, W, H - FLOOR_Y))
             
-            # Decorative clouds with HAL Lab tweening
+            # Decorative clouds with HAL Lab tweening — scale the
+            # pre-rendered cloud instead of rasterizing ellipses
+            ticks = pygame.time.get_ticks()
             for i in range(3):
-                cloud_x = (i * 300 - game.camera_x * 0.3) % (W + 200) - 100
+                cloud_x = (i * 300 - camera_x * 0.3) % (W + 200) - 100
                 cloud_y = 50 + i * 40
-                cloud_bounce = math.sin(pygame.time.get_ticks() * 0.001 + i) * 5
-                cloud_width = int(80 * (1.0 + math.sin(pygame.time.get_ticks() * 0.002 + i) * 0.1))
-                cloud_height = int(40 * (1.0 - math.sin(pygame.time.get_ticks() * 0.002 + i) * 0.1))
-                
-                pygame.draw.ellipse(game_surface, WHITE, 
-                                  (int(cloud_x), cloud_y + cloud_bounce, cloud_width, cloud_height))
-                pygame.draw.ellipse(game_surface, WHITE, 
-                                  (int(cloud_x) + 30, cloud_y - 10 + cloud_bounce, 
-                                   int(cloud_width * 0.75), int(cloud_height * 0.875)))
-            
-            # Draw entities
-            game.player.draw(game_surface, game.camera_x)
-            
-            for enemy in game.enemies:
-                enemy.draw(game_surface, game.camera_x)
-            
+                cloud_bounce = math.sin(ticks * 0.001 + i) * 5
+                breathe = math.sin(ticks * 0.002 + i) * 0.1
+                cloud = pygame.transform.scale(
+                    CLOUD_SURF, (int(110 * (1.0 + breathe)),
+                                 int(50 * (1.0 - breathe))))
+                game_surface.blit(cloud, (int(cloud_x),
+                                          int(cloud_y - 10 + cloud_bounce)))
+            
+            # Draw entities — skip anything outside the camera view so
+            # offscreen stretches of the level cost no draw dispatch
+            cam_l, cam_r = camera_x - 64, camera_x + W + 64
+            player.draw(game_surface, camera_x)
+
+            for enemy in enemies:
+                if cam_l <= enemy.x <= cam_r:
+                    enemy.draw(game_surface, camera_x)
+
             if game.boss:
-                game.boss.draw(game_surface, game.camera_x)
-            
+                game.boss.draw(game_surface, camera_x)
+
             for proj in projectiles:
-                proj.draw(game_surface, game.camera_x)
-            
-            for particle in particles:
-                particle.draw(game_surface, game.camera_x)
+                if cam_l <= proj.x <= cam_r:
+                    proj.draw(game_surface, camera_x)
+
+            particles.draw(game_surface, camera_x)
             
             # Blit game surface with shake
             screen.blit(game_surface, (shake_x, shake_y))
@@ -2813,26 +3067,19 @@ async def main():
             level_text = big_font.render(level_name, True, WHITE)
             level_rect = level_text.get_rect(center=(W//2, 80 + level_bounce))
             screen.blit(level_text, level_rect)
-            
-            # Pause
-            if inputs.just_pressed("pause"):
-                game.state = "paused"
-        
+
         # Paused
         elif game.state == "paused":
             # Darken screen
-            overlay = pygame.Surface((W, H))
-            overlay.set_alpha(128)
-            overlay.fill(BLACK)
-            screen.blit(overlay, (0, 0))
+            screen.blit(PAUSE_OVERLAY, (0, 0))
             
             # Paused text with bounce animation
             pause_bounce = math.sin(pygame.time.get_ticks() * 0.003) * 5
-            pause_text = ultra_font.render("PAUSED", True, WHITE)
+            pause_text = cached_text("paused", ultra_font, "PAUSED", WHITE)
             pause_rect = pause_text.get_rect(center=(W//2, H//2 + pause_bounce))
             screen.blit(pause_text, pause_rect)
-            
-            hint_text = font.render("Press ESC to Resume", True, WHITE)
+
+            hint_text = cached_text("pause_hint", font, "Press ESC to Resume", WHITE)
             hint_rect = hint_text.get_rect(center=(W//2, H//2 + 50))
             screen.blit(hint_text, hint_rect)
         
@@ -2842,19 +3089,21 @@ async def main():
             
             # Victory text with bounce animation
             victory_bounce = math.sin(pygame.time.get_ticks() * 0.003) * 10
-            victory_text = ultra_font.render("VICTORY!", True, WHITE)
+            victory_text = cached_text("victory", ultra_font, "VICTORY!", WHITE)
             victory_rect = victory_text.get_rect(center=(W//2, H//2 - 100 + victory_bounce))
             screen.blit(victory_text, victory_rect)
             
-            score_text = big_font.render(f"Final Score: {game.score:08d}", True, WHITE)
+            # Score is frozen on this screen — key the cache on its value
+            score_text = cached_text(("final_score", game.score), big_font,
+                                     f"Final Score: {game.score:08d}", WHITE)
             score_rect = score_text.get_rect(center=(W//2, H//2))
             screen.blit(score_text, score_rect)
             
-            congrats = font.render("You saved Dream Land from darkness!", True, WHITE)
+            congrats = cached_text("congrats", font, "You saved Dream Land from darkness!", WHITE)
             congrats_rect = congrats.get_rect(center=(W//2, H//2 + 50))
             screen.blit(congrats, congrats_rect)
             
-            restart_text = font.render("Press ENTER to Play Again", True, WHITE)
+            restart_text = cached_text("restart", font, "Press ENTER to Play Again", WHITE)
             restart_rect = restart_text.get_rect(center=(W//2, H//2 + 100))
             screen.blit(restart_text, restart_rect)
             
@@ -2863,9 +3112,8 @@ async def main():
                 create_star_particles(random.randint(50, W - 50), 
                                     random.randint(50, H - 50))
             
-            for particle in particles:
-                particle.update(0.016)
-                particle.draw(screen, 0)
+            particles.update(0.016)
+            particles.draw(screen, 0)
             
             if inputs.just_pressed("start"):
                 game.score = 0
@@ -2878,15 +3126,16 @@ async def main():
             
             # Game over text with bounce animation
             game_over_bounce = math.sin(pygame.time.get_ticks() * 0.003) * 5
-            game_over_text = ultra_font.render("GAME OVER", True, WHITE)
+            game_over_text = cached_text("game_over", ultra_font, "GAME OVER", WHITE)
             game_over_rect = game_over_text.get_rect(center=(W//2, H//2 - 50 + game_over_bounce))
             screen.blit(game_over_text, game_over_rect)
             
-            score_text = big_font.render(f"Score: {game.score:08d}", True, WHITE)
+            score_text = cached_text(("game_over_score", game.score), big_font,
+                                     f"Score: {game.score:08d}", WHITE)
             score_rect = score_text.get_rect(center=(W//2, H//2 + 20))
             screen.blit(score_text, score_rect)
             
-            continue_text = font.render("Press ENTER to Try Again", True, WHITE)
+            continue_text = cached_text("continue", font, "Press ENTER to Try Again", WHITE)
             continue_rect = continue_text.get_rect(center=(W//2, H//2 + 70))
             screen.blit(continue_text, continue_rect)
             
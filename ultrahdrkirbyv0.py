@@ -38,6 +38,7 @@ GROUND_Y = 330
 GRAVITY  = 0.6
 JUMP_PWR = -10
 MOVE_SPD = 4
+PHYSICS_STEP = 1 / 60  # fixed simulation tick, decoupled from render rate
 SKY = (140, 200, 255)
 GRASS = (80, 200, 80)
 PINK = (255, 120, 200)
@@ -53,7 +54,10 @@ class Puff:
         self.vx, self.vy = 0, 0
         self.on_ground = True
         self.r = 18
-    def rect(self): return pygame.Rect(self.x-self.r, self.y-self.r, self.r*2, self.r*2)
+        self._rect = pygame.Rect(0, 0, self.r*2, self.r*2)  # reused; callers don't keep it
+    def rect(self):
+        self._rect.topleft = (self.x-self.r, self.y-self.r)
+        return self._rect
     def update(self, keys):
         self.vx = (-MOVE_SPD if keys[pygame.K_a] else MOVE_SPD if keys[pygame.K_d] else 0)
         if keys[pygame.K_w]: self.vy -= 0.2
@@ -86,7 +90,10 @@ class Waddle:
         self.y = GROUND_Y
         self.dir = random.choice([-1,1])
         self.dead = False
-    def rect(self): return pygame.Rect(self.x-10, self.y-10, 20, 20)
+        self._rect = pygame.Rect(0, 0, 20, 20)
+    def rect(self):
+        self._rect.topleft = (self.x-10, self.y-10)
+        return self._rect
     def update(self):
         self.x += self.dir * 2
         if self.x < 50 or self.x > W-50: self.dir *= -1
@@ -102,7 +109,10 @@ class TreeBoss:
         self.x, self.y = x, GROUND_Y-60
         self.hp = 5
         self.timer = 0
-    def rect(self): return pygame.Rect(self.x-40, self.y-80, 80, 140)
+        self._rect = pygame.Rect(0, 0, 80, 140)
+    def rect(self):
+        self._rect.topleft = (self.x-40, self.y-80)
+        return self._rect
     def update(self):
         self.timer += 1
     def draw(self, surf):
@@ -138,9 +148,11 @@ def draw_background(surf, scroll):
     pygame.draw.rect(surf, GRASS, (0,GROUND_Y,W,H-GROUND_Y))
 
 # ------------------------------------------------------------
-# Main loop
+# Main loop (fixed-timestep simulation, render once per frame)
 # ------------------------------------------------------------
+accumulator = 0.0
 while True:
+    frame_ms = clock.tick(60 if state == "play" else 30)
     for e in pygame.event.get():
         if e.type == pygame.QUIT: pygame.quit(); sys.exit()
         if e.type == pygame.KEYDOWN:
@@ -158,31 +170,33 @@ while True:
         screen.blit(title, (W/2 - title.get_width()/2, 150))
         screen.blit(hint,  (W/2 - hint.get_width()/2, 200))
     elif state == "play":
-        # scrolling background
-        scroll_x = (scroll_x + player.vx) % 1200
-        draw_background(screen, scroll_x)
+        # run as many fixed physics ticks as the frame time covers
+        accumulator += min(frame_ms / 1000.0, 0.1)
+        while accumulator >= PHYSICS_STEP:
+            scroll_x = (scroll_x + player.vx) % 1200
+            player.update(keys)
+            for w in enemies:
+                if not w.dead:
+                    w.update()
+                    if w.rect().colliderect(player.rect()):
+                        pop_snd.play()
+                        w.dead = True
+                        score += 1
+            if boss.x - scroll_x < W:
+                boss.update()
+                if boss.rect().colliderect(player.rect()) and boss.hp > 0:
+                    boss.hp -= 1
+                    pop_snd.play()
+                    if boss.hp <= 0:
+                        state = "win"
+            accumulator -= PHYSICS_STEP
 
-        player.update(keys)
+        draw_background(screen, scroll_x)
         player.draw(screen)
-
         for w in enemies:
-            if not w.dead:
-                w.update()
-                if w.rect().colliderect(player.rect()):
-                    pop_snd.play()
-                    w.dead = True
-                    score += 1
             w.draw(screen)
-
         if boss.x - scroll_x < W:
-            boss.update()
             boss.draw(screen)
-            if boss.rect().colliderect(player.rect()) and boss.hp > 0:
-                boss.hp -= 1
-                pop_snd.play()
-                if boss.hp <= 0:
-                    state = "win"
-
         screen.blit(font.render(f"Score: {score}", True, (0,0,0)), (10,10))
     elif state == "win":
         screen.fill((255,230,250))
@@ -191,7 +205,6 @@ while True:
         if keys[pygame.K_RETURN]: state = "menu"
 
     pygame.display.flip()
-    clock.tick(60)
 #!/usr/bin/env python3
 # ============================================================
 #  Dream Puff Engine 1.0  [C] Samsoft 2025
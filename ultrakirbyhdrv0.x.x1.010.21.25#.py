@@ -5,7 +5,8 @@
 #  Features: 7 Copy Abilities, 6 Bosses, Particle System
 # ============================================================
 
-import pygame, numpy as np, math, random, sys, asyncio, platform
+import pygame, numpy as np, array, functools, math, random, sys, asyncio, platform
+from collections import namedtuple
 from enum import Enum
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
@@ -51,6 +52,24 @@ TORNADO_GREEN = (100, 255, 100)
 FLOOR_Y = 400
 LEVEL_LEN = 3600
 
+# 1024-entry sine table for animation-grade trig (hammer swing, wing
+# flap, float bobbing): a table read beats a transcendental call and
+# the quantization is invisible at these amplitudes. Projectile spawn
+# angles keep exact math.sin/cos.
+_LUT_SIZE = 1024
+_LUT_SCALE = _LUT_SIZE / (2 * math.pi)
+_SIN_LUT = array.array('f', (math.sin(2 * math.pi * i / _LUT_SIZE)
+                             for i in range(_LUT_SIZE)))
+
+def fsin(x):
+    return _SIN_LUT[int(x * _LUT_SCALE) & (_LUT_SIZE - 1)]
+
+def fcos(x):
+    return _SIN_LUT[(int(x * _LUT_SCALE) + _LUT_SIZE // 4) & (_LUT_SIZE - 1)]
+
+# Shared generator so whole waves of random values come from one C call
+RNG = np.random.default_rng()
+
 font = pygame.font.Font(None, 18)
 big_font = pygame.font.Font(None, 32)
 ultra_font = pygame.font.Font(None, 48)
@@ -208,36 +227,133 @@ inputs = Input()
 # ============================================================
 # Projectile System
 # ============================================================
-class Projectile:
-    def __init__(self, x, y, vx, vy, damage, ability, owner="player"):
-        self.x, self.y = x, y
-        self.vx, self.vy = vx, vy
-        self.damage = damage
-        self.ability = ability
-        self.owner = owner
-        self.lifetime = 2.0
-        self.dead = False
-    
-    def rect(self):
-        return pygame.Rect(int(self.x - 10), int(self.y - 10), 20, 20)
-    
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+MAX_PROJECTILES = 512
+OWNER_PLAYER = 0
+OWNER_BOSS = 1
+PROJECTILE_LIFETIME = 2.0
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _proj_step(x, y, vx, vy, lifetime, alive, dt, floor_limit):
+        for i in prange(x.shape[0]):
+            if alive[i]:
+                x[i] += vx[i] * dt
+                y[i] += vy[i] * dt
+                lifetime[i] -= dt
+                if lifetime[i] <= 0.0 or y[i] > floor_limit:
+                    alive[i] = False
+else:
+    def _proj_step(x, y, vx, vy, lifetime, alive, dt, floor_limit):
+        # Pure-NumPy fallback: integrate every slot (stale values in
+        # dead slots are harmless) and re-mask alive in place.
+        x += vx * dt
+        y += vy * dt
+        lifetime -= dt
+        np.logical_and(alive, (lifetime > 0) & (y <= floor_limit), out=alive)
+
+def _build_proj_sprites():
+    # One tiny sprite per ability so the draw pass is pure blits
+    sprites = {}
+    for a in Ability:
+        s = pygame.Surface((16, 16), pygame.SRCALPHA)
+        pygame.draw.circle(s, ABILITY_COLORS.get(a, WHITE), (8, 8), 8)
+        if a == Ability.FIRE:
+            pygame.draw.circle(s, FIRE_RED, (8, 8), 4)
+        sprites[a.value] = s
+    return sprites
+
+_PROJ_SPRITES = _build_proj_sprites()
+
+class ProjectilePool:
+    """Structure-of-arrays projectile store.
+
+    Each scalar lives in its own preallocated NumPy array, so the
+    per-frame integration/expiry pass is a handful of vector ops
+    instead of a Python loop over objects, and boss volleys can write
+    a whole wave of positions/velocities in one call (spawn_batch).
+    Collision code reads the arrays directly by slot index.
+    """
+    def __init__(self, capacity=MAX_PROJECTILES):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.vx = np.zeros(capacity, np.float32)
+        self.vy = np.zeros(capacity, np.float32)
+        self.lifetime = np.zeros(capacity, np.float32)
+        self.damage = np.zeros(capacity, np.int8)
+        self.ability = np.zeros(capacity, np.uint8)
+        self.owner = np.zeros(capacity, np.uint8)
+        self.alive = np.zeros(capacity, bool)
+        self._cursor = 0
+        self._rect = pygame.Rect(0, 0, 20, 20)
+
+    def __len__(self):
+        return int(self.alive.sum())
+
+    def spawn(self, x, y, vx, vy, damage, ability, owner="player"):
+        i = self._cursor
+        self._cursor = (i + 1) % self.capacity
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.lifetime[i] = PROJECTILE_LIFETIME
+        self.damage[i] = damage
+        self.ability[i] = ability.value
+        self.owner[i] = OWNER_BOSS if owner == "boss" else OWNER_PLAYER
+        self.alive[i] = True
+
+    def spawn_batch(self, xs, ys, vxs, vys, damage, ability, owner="player"):
+        # Whole-wave spawn: one array write per field into the next n
+        # ring-buffer slots.
+        n = len(xs)
+        idx = (self._cursor + np.arange(n)) % self.capacity
+        self._cursor = int((self._cursor + n) % self.capacity)
+        self.x[idx] = xs
+        self.y[idx] = ys
+        self.vx[idx] = vxs
+        self.vy[idx] = vys
+        self.lifetime[idx] = PROJECTILE_LIFETIME
+        self.damage[idx] = damage
+        self.ability[idx] = ability.value
+        self.owner[idx] = OWNER_BOSS if owner == "boss" else OWNER_PLAYER
+        self.alive[idx] = True
+
+    def clear(self):
+        self.alive[:] = False
+
+    def rect(self, i):
+        # Shared scratch Rect, only valid until the next rect() call
+        self._rect.topleft = (int(self.x[i] - 10), int(self.y[i] - 10))
+        return self._rect
+
+    def active(self, owner=None):
+        mask = self.alive
+        if owner is not None:
+            mask = mask & (self.owner == owner)
+        return np.nonzero(mask)[0]
+
     def update(self, dt):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.lifetime -= dt
-        if self.lifetime <= 0 or self.y > FLOOR_Y + 50:
-            self.dead = True
-    
+        _proj_step(self.x, self.y, self.vx, self.vy,
+                   self.lifetime, self.alive, dt, FLOOR_Y + 50)
+
     def draw(self, surf, camx):
-        if self.dead:
-            return
-        sx = int(self.x - camx)
-        color = ABILITY_COLORS.get(self.ability, WHITE)
-        pygame.draw.circle(surf, color, (sx, int(self.y)), 8)
-        if self.ability == Ability.FIRE:
-            pygame.draw.circle(surf, FIRE_RED, (sx, int(self.y)), 4)
+        # Gather all visible projectiles and hand them to SDL in a
+        # single blits() call instead of one draw call each
+        sprites = _PROJ_SPRITES
+        draws = [(sprites[self.ability[i]],
+                  (int(self.x[i] - camx) - 8, int(self.y[i]) - 8))
+                 for i in self.active()]
+        if draws:
+            surf.blits(draws, doreturn=False)
 
-projectiles: List[Projectile] = []
+projectiles = ProjectilePool()
 
 # ============================================================
 # Enhanced Kirby with Copy Abilities
@@ -358,13 +474,13 @@ class Kirby:
             # Fire breath
             for i in range(3):
                 offset = (i - 1) * 15
-                projectiles.append(Projectile(
+                projectiles.spawn(
                     self.x + (40 if self.facing_right else -40),
                     self.y + offset,
                     (300 if self.facing_right else -300) + random.randint(-50, 50),
                     random.randint(-50, 50),
                     2, Ability.FIRE
-                ))
+                )
             create_explosion(self.x + (30 if self.facing_right else -30), 
                            self.y, FIRE_ORANGE, 10)
         
@@ -372,13 +488,13 @@ class Kirby:
             if sounds["ice"]:
                 sounds["ice"].play()
             # Ice breath
-            projectiles.append(Projectile(
+            projectiles.spawn(
                 self.x + (30 if self.facing_right else -30),
                 self.y,
                 250 if self.facing_right else -250,
                 0,
                 2, Ability.ICE
-            ))
+            )
             for _ in range(5):
                 particles.append(Particle(
                     self.x + (30 if self.facing_right else -30),
@@ -391,16 +507,13 @@ class Kirby:
         elif self.ability == Ability.SPARK:
             if sounds["spark"]:
                 sounds["spark"].play()
-            # Electric field
+            # Electric field (12 shots; bind the lookups once)
+            _cos, _sin, spawn = math.cos, math.sin, projectiles.spawn
             for angle in range(0, 360, 30):
                 rad = math.radians(angle)
-                projectiles.append(Projectile(
-                    self.x + math.cos(rad) * 40,
-                    self.y + math.sin(rad) * 40,
-                    math.cos(rad) * 200,
-                    math.sin(rad) * 200,
-                    1, Ability.SPARK
-                ))
+                c, s = _cos(rad), _sin(rad)
+                spawn(self.x + c * 40, self.y + s * 40,
+                      c * 200, s * 200, 1, Ability.SPARK)
             create_explosion(self.x, self.y, SPARK_YELLOW, 15)
         
         elif self.ability == Ability.STONE:
@@ -415,25 +528,25 @@ class Kirby:
             if sounds["sword"]:
                 sounds["sword"].play()
             # Sword slash
-            projectiles.append(Projectile(
+            projectiles.spawn(
                 self.x + (40 if self.facing_right else -40),
                 self.y,
                 400 if self.facing_right else -400,
                 -50,
                 3, Ability.SWORD
-            ))
+            )
         
         elif self.ability == Ability.BEAM:
             if sounds["beam"]:
                 sounds["beam"].play()
             # Whip beam
-            projectiles.append(Projectile(
+            projectiles.spawn(
                 self.x + (30 if self.facing_right else -30),
                 self.y,
                 350 if self.facing_right else -350,
                 0,
                 2, Ability.BEAM
-            ))
+            )
             for _ in range(3):
                 particles.append(Particle(
                     self.x + (30 if self.facing_right else -30),
@@ -448,13 +561,13 @@ class Kirby:
                 sounds["tornado"].play()
             # Tornado spin
             self.vx = 400 if self.facing_right else -400
+            _cos, _sin = math.cos, math.sin
             for i in range(8):
                 angle = i * math.pi / 4
+                c, s = _cos(angle), _sin(angle)
                 particles.append(Particle(
-                    self.x + math.cos(angle) * 30,
-                    self.y + math.sin(angle) * 30,
-                    math.cos(angle) * 100,
-                    math.sin(angle) * 100,
+                    self.x + c * 30, self.y + s * 30,
+                    c * 100, s * 100,
                     TORNADO_GREEN, 0.6, 5
                 ))
     
@@ -679,12 +792,26 @@ class SwordKnight(Enemy):
 # Boss Classes
 # ============================================================
 class Boss:
+    _RECT_SIZE = (0, 0)  # (w, h), set by each subclass
+
     def __init__(self, x, y, hp):
         self.x, self.y = float(x), float(y)
         self.hp, self.max_hp = hp, hp
         self.last_hit = 1.0
         self.attack_timer = 0.0
         self.state = "idle"
+        # Reused collision rect; rect() moves it instead of allocating
+        self._rect = pygame.Rect((0, 0), self._RECT_SIZE)
+        # Rendered once here; the HUD blits it every frame
+        self.name_surface = font.render(type(self).__name__, True, WHITE)
+
+    @staticmethod
+    def _white_flash(sprite):
+        # Hit-flash variant: same silhouette pushed to solid white with
+        # one blend fill, so _build_sprite doesn't need color branches
+        flash = sprite.copy()
+        flash.fill(WHITE, special_flags=pygame.BLEND_RGB_MAX)
+        return flash
     
     def take_damage(self, damage=1):
         if self.last_hit > 0.5:
@@ -695,67 +822,104 @@ class Boss:
             create_explosion(self.x, self.y - 50, WHITE, 15)
 
 class WhispyWoods(Boss):
+    _RECT_SIZE = (120, 180)
+    _SPRITES = None  # (normal, hit-flash), baked on first spawn
+
     def __init__(self, x):
         super().__init__(x, FLOOR_Y, 15)
         self.apple_timer = 0.0
-    
+        if WhispyWoods._SPRITES is None:
+            base = self._build_sprite()
+            WhispyWoods._SPRITES = (base, self._white_flash(base))
+
+    @staticmethod
+    def _build_sprite():
+        # Anchor: blit at (sx - 70, y - 210)
+        s = pygame.Surface((140, 210), pygame.SRCALPHA)
+        # Trunk
+        pygame.draw.rect(s, (139, 69, 19), (30, 60, 80, 150))
+        # Leaves
+        pygame.draw.circle(s, (34, 139, 34), (70, 70), 70)
+        # Eyes
+        pygame.draw.circle(s, BLACK, (50, 70), 8)
+        pygame.draw.circle(s, BLACK, (90, 70), 8)
+        # Angry eyebrows
+        pygame.draw.line(s, BLACK, (40, 60), (60, 65), 3)
+        pygame.draw.line(s, BLACK, (100, 60), (80, 65), 3)
+        return s
+
     def rect(self):
-        return pygame.Rect(int(self.x - 60), int(self.y - 180), 120, 180)
+        self._rect.topleft = (int(self.x - 60), int(self.y - 180))
+        return self._rect
     
     def update(self, dt, player):
         self.last_hit += dt
         self.attack_timer += dt
         self.apple_timer += dt
-        
+
+        # Far off-camera: keep the timers ticking but skip attacks and
+        # movement until the player gets close
+        if abs(self.x - game.camera_x - W / 2) > W * 1.5:
+            return
+
         # Drop apples
         if self.apple_timer > 2.0:
             self.apple_timer = 0.0
             # Create falling apple projectile
             apple_x = self.x + random.randint(-100, 100)
-            projectiles.append(Projectile(
+            projectiles.spawn(
                 apple_x, self.y - 200,
                 0, 150,
                 1, Ability.NONE, "boss"
-            ))
+            )
     
     def draw(self, surf, camx):
         sx = int(self.x - camx)
-        if -150 <= sx <= W + 150:
-            # Flash white when hit
-            trunk_color = (139, 69, 19) if self.last_hit > 0.2 else WHITE
-            leaves_color = (34, 139, 34) if self.last_hit > 0.2 else WHITE
-            
-            # Trunk
-            pygame.draw.rect(surf, trunk_color, 
-                           (sx - 40, int(self.y) - 150, 80, 150))
-            # Leaves
-            pygame.draw.circle(surf, leaves_color, 
-                          (sx, int(self.y) - 140), 70)
-            # Eyes
-            pygame.draw.circle(surf, BLACK, (sx - 20, int(self.y) - 140), 8)
-            pygame.draw.circle(surf, BLACK, (sx + 20, int(self.y) - 140), 8)
-            # Angry eyebrows
-            pygame.draw.line(surf, BLACK, 
-                           (sx - 30, int(self.y) - 150), 
-                           (sx - 10, int(self.y) - 145), 3)
-            pygame.draw.line(surf, BLACK, 
-                           (sx + 30, int(self.y) - 150), 
-                           (sx + 10, int(self.y) - 145), 3)
+        if not -150 <= sx <= W + 150:
+            return
+        sprite = self._SPRITES[self.last_hit <= 0.2]
+        surf.blit(sprite, (sx - 70, int(self.y) - 210))
 
 class KingDedede(Boss):
+    _RECT_SIZE = (100, 80)
+    _SPRITES = None
+
     def __init__(self, x):
         super().__init__(x, FLOOR_Y, 25)
         self.vy = 0.0
         self.hammer_angle = 0
-    
+        if KingDedede._SPRITES is None:
+            base = self._build_sprite()
+            KingDedede._SPRITES = (base, self._white_flash(base))
+
+    @staticmethod
+    def _build_sprite():
+        # Anchor: blit at (sx - 50, y - 100); the hammer animates so it
+        # stays a dynamic draw on top.
+        s = pygame.Surface((100, 110), pygame.SRCALPHA)
+        # Body
+        pygame.draw.circle(s, (0, 0, 200), (50, 60), 50)
+        # Crown
+        pygame.draw.polygon(s, (255, 215, 0), [
+            (20, 20), (30, 0), (40, 15), (50, 5),
+            (60, 15), (70, 0), (80, 20)
+        ])
+        return s
+
     def rect(self):
-        return pygame.Rect(int(self.x - 50), int(self.y - 80), 100, 80)
+        self._rect.topleft = (int(self.x - 50), int(self.y - 80))
+        return self._rect
     
     def update(self, dt, player):
         self.last_hit += dt
         self.attack_timer += dt
         self.hammer_angle += dt * 2
-        
+
+        # Far off-camera: keep the timers ticking but skip attacks and
+        # movement until the player gets close
+        if abs(self.x - game.camera_x - W / 2) > W * 1.5:
+            return
+
         if self.state == "idle":
             if self.attack_timer > 2.5:
                 self.state = "jumping"
@@ -775,15 +939,11 @@ class KingDedede(Boss):
             if self.y >= FLOOR_Y:
                 self.y = FLOOR_Y
                 self.state = "slam"
-                # Create shockwave
-                for i in range(-3, 4):
-                    projectiles.append(Projectile(
-                        self.x + i * 30,
-                        FLOOR_Y,
-                        i * 100,
-                        -200,
-                        1, Ability.STONE, "boss"
-                    ))
+                # Create shockwave as one batched spawn
+                i = np.arange(-3, 4)
+                projectiles.spawn_batch(self.x + i * 30, np.full(7, FLOOR_Y),
+                                        i * 100.0, np.full(7, -200.0),
+                                        1, Ability.STONE, "boss")
                 create_explosion(self.x, FLOOR_Y, STONE_GRAY, 20)
         
         elif self.state == "slam":
@@ -793,44 +953,63 @@ class KingDedede(Boss):
     
     def draw(self, surf, camx):
         sx = int(self.x - camx)
-        if -150 <= sx <= W + 150:
-            body_color = (0, 0, 200) if self.last_hit > 0.2 else WHITE
-            
-            # Body
-            pygame.draw.circle(surf, body_color, 
-                             (sx, int(self.y) - 40), 50)
-            # Crown
-            pygame.draw.polygon(surf, (255, 215, 0), [
-                (sx - 30, int(self.y) - 80),
-                (sx - 20, int(self.y) - 100),
-                (sx - 10, int(self.y) - 85),
-                (sx, int(self.y) - 95),
-                (sx + 10, int(self.y) - 85),
-                (sx + 20, int(self.y) - 100),
-                (sx + 30, int(self.y) - 80)
-            ])
-            # Hammer
-            hammer_x = sx + math.cos(self.hammer_angle) * 60
-            hammer_y = int(self.y) - 40 + math.sin(self.hammer_angle) * 30
-            pygame.draw.rect(surf, (139, 69, 19), 
-                           (int(hammer_x) - 5, int(hammer_y) - 30, 10, 40))
-            pygame.draw.rect(surf, SWORD_SILVER, 
-                           (int(hammer_x) - 20, int(hammer_y) - 35, 40, 15))
+        if not -150 <= sx <= W + 150:
+            return
+        sprite = self._SPRITES[self.last_hit <= 0.2]
+        surf.blit(sprite, (sx - 50, int(self.y) - 100))
+        # Hammer
+        hammer_x = sx + fcos(self.hammer_angle) * 60
+        hammer_y = int(self.y) - 40 + fsin(self.hammer_angle) * 30
+        pygame.draw.rect(surf, (139, 69, 19), 
+                       (int(hammer_x) - 5, int(hammer_y) - 30, 10, 40))
+        pygame.draw.rect(surf, SWORD_SILVER, 
+                       (int(hammer_x) - 20, int(hammer_y) - 35, 40, 15))
 
 class MetaKnight(Boss):
+    _RECT_SIZE = (50, 70)
+    _SPRITES = None
+
     def __init__(self, x):
         super().__init__(x, FLOOR_Y - 30, 20)
         self.teleport_timer = 0.0
         self.sword_attacks = []
-    
+        if MetaKnight._SPRITES is None:
+            base = self._build_sprite()
+            MetaKnight._SPRITES = (base, self._white_flash(base))
+
+    @staticmethod
+    def _build_sprite():
+        # Anchor: blit at (sx - 26, y - 31)
+        s = pygame.Surface((72, 62), pygame.SRCALPHA)
+        # Cape
+        pygame.draw.polygon(s, (75, 0, 130), [
+            (1, 61), (51, 61), (46, 11), (6, 11)
+        ])
+        # Body
+        pygame.draw.circle(s, (0, 0, 100), (26, 31), 20)
+        # Mask
+        pygame.draw.ellipse(s, SWORD_SILVER, (11, 16, 30, 25))
+        # Eyes
+        pygame.draw.circle(s, (255, 255, 0), (19, 26), 4)
+        pygame.draw.circle(s, (255, 255, 0), (33, 26), 4)
+        # Sword
+        pygame.draw.line(s, WHITE, (51, 21), (71, 1), 3)
+        return s
+
     def rect(self):
-        return pygame.Rect(int(self.x - 25), int(self.y - 35), 50, 70)
+        self._rect.topleft = (int(self.x - 25), int(self.y - 35))
+        return self._rect
     
     def update(self, dt, player):
         self.last_hit += dt
         self.attack_timer += dt
         self.teleport_timer += dt
-        
+
+        # Far off-camera: keep the timers ticking but skip attacks and
+        # movement until the player gets close
+        if abs(self.x - game.camera_x - W / 2) > W * 1.5:
+            return
+
         # Teleport
         if self.teleport_timer > 3.0:
             self.teleport_timer = 0.0
@@ -843,117 +1022,147 @@ class MetaKnight(Boss):
         # Sword wave attack
         if self.attack_timer > 1.5:
             self.attack_timer = 0.0
-            for i in range(3):
-                angle = math.radians(i * 30 - 30)
-                projectiles.append(Projectile(
-                    self.x,
-                    self.y,
-                    math.cos(angle) * 300 * (1 if player.x > self.x else -1),
-                    math.sin(angle) * 150,
-                    2, Ability.SWORD, "boss"
-                ))
+            angles = np.radians(np.arange(3) * 30 - 30)
+            direction = 1 if player.x > self.x else -1
+            projectiles.spawn_batch(
+                np.full(3, self.x), np.full(3, self.y),
+                np.cos(angles) * 300 * direction,
+                np.sin(angles) * 150,
+                2, Ability.SWORD, "boss"
+            )
     
     def draw(self, surf, camx):
         sx = int(self.x - camx)
-        if -100 <= sx <= W + 100:
-            # Cape
-            cape_color = (75, 0, 130) if self.last_hit > 0.2 else WHITE
-            pygame.draw.polygon(surf, cape_color, [
-                (sx - 25, int(self.y) + 30),
-                (sx + 25, int(self.y) + 30),
-                (sx + 20, int(self.y) - 20),
-                (sx - 20, int(self.y) - 20)
-            ])
-            # Body
-            pygame.draw.circle(surf, (0, 0, 100), (sx, int(self.y)), 20)
-            # Mask
-            pygame.draw.ellipse(surf, SWORD_SILVER, 
-                              (sx - 15, int(self.y) - 15, 30, 25))
-            # Eyes
-            pygame.draw.circle(surf, (255, 255, 0), 
-                             (sx - 7, int(self.y) - 5), 4)
-            pygame.draw.circle(surf, (255, 255, 0), 
-                             (sx + 7, int(self.y) - 5), 4)
-            # Sword
-            pygame.draw.line(surf, WHITE, 
-                           (sx + 25, int(self.y) - 10),
-                           (sx + 45, int(self.y) - 30), 3)
+        if not -100 <= sx <= W + 100:
+            return
+        sprite = self._SPRITES[self.last_hit <= 0.2]
+        surf.blit(sprite, (sx - 26, int(self.y) - 31))
 
 class NightmareWizard(Boss):
+    _RECT_SIZE = (80, 80)
+    _SPRITES = None
+    _AURA = None
+
     def __init__(self, x):
         super().__init__(x, FLOOR_Y - 100, 30)
         self.float_time = 0.0
         self.orb_angle = 0.0
-    
+        if NightmareWizard._SPRITES is None:
+            base = self._build_sprite()
+            NightmareWizard._SPRITES = (base, self._white_flash(base))
+            NightmareWizard._AURA = self._build_aura()
+
+    @staticmethod
+    def _build_aura():
+        # The three stroked aura rings look identical every frame;
+        # rasterize them once. Anchor: blit at (sx - 82, y - 82)
+        s = pygame.Surface((164, 164), pygame.SRCALPHA)
+        for i in range(3):
+            size = 50 + i * 15
+            color = (100 - i * 30, 0, 100 - i * 30)
+            pygame.draw.circle(s, color, (82, 82), size, 2)
+        return s
+
+    @staticmethod
+    def _build_sprite():
+        # Anchor: blit at (sx - 36, y - 36)
+        s = pygame.Surface((72, 72), pygame.SRCALPHA)
+        # Body
+        pygame.draw.circle(s, (50, 0, 100), (36, 36), 35)
+        # Eyes
+        pygame.draw.polygon(s, (255, 0, 0), [(21, 26), (28, 31), (21, 36)])
+        pygame.draw.polygon(s, (255, 0, 0), [(51, 26), (44, 31), (51, 36)])
+        return s
+
     def rect(self):
-        return pygame.Rect(int(self.x - 40), int(self.y - 40), 80, 80)
+        self._rect.topleft = (int(self.x - 40), int(self.y - 40))
+        return self._rect
     
     def update(self, dt, player):
         self.last_hit += dt
         self.attack_timer += dt
         self.float_time += dt
         self.orb_angle += dt * 2
-        
+
+        # Far off-camera: keep the timers ticking but skip attacks and
+        # movement until the player gets close
+        if abs(self.x - game.camera_x - W / 2) > W * 1.5:
+            return
+
         # Float motion
-        self.y = FLOOR_Y - 100 + math.sin(self.float_time) * 30
+        self.y = FLOOR_Y - 100 + fsin(self.float_time) * 30
         
         # Dark orb attack
         if self.attack_timer > 2.0:
             self.attack_timer = 0.0
-            for i in range(6):
-                angle = i * math.pi / 3
-                projectiles.append(Projectile(
-                    self.x + math.cos(angle) * 50,
-                    self.y + math.sin(angle) * 50,
-                    math.cos(angle) * 200,
-                    math.sin(angle) * 200,
-                    2, Ability.BEAM, "boss"
-                ))
+            angles = np.arange(6) * (math.pi / 3)
+            cos_a, sin_a = np.cos(angles), np.sin(angles)
+            projectiles.spawn_batch(
+                self.x + cos_a * 50, self.y + sin_a * 50,
+                cos_a * 200, sin_a * 200,
+                2, Ability.BEAM, "boss"
+            )
     
     def draw(self, surf, camx):
         sx = int(self.x - camx)
-        if -100 <= sx <= W + 100:
-            # Dark aura
-            for i in range(3):
-                alpha = (3 - i) / 3
-                size = 50 + i * 15
-                color = (100 - i*30, 0, 100 - i*30)
-                pygame.draw.circle(surf, color, (sx, int(self.y)), size, 2)
-            
-            # Body
-            body_color = (50, 0, 100) if self.last_hit > 0.2 else WHITE
-            pygame.draw.circle(surf, body_color, (sx, int(self.y)), 35)
-            
-            # Eyes
-            pygame.draw.polygon(surf, (255, 0, 0), [
-                (sx - 15, int(self.y) - 10),
-                (sx - 8, int(self.y) - 5),
-                (sx - 15, int(self.y))
-            ])
-            pygame.draw.polygon(surf, (255, 0, 0), [
-                (sx + 15, int(self.y) - 10),
-                (sx + 8, int(self.y) - 5),
-                (sx + 15, int(self.y))
-            ])
+        if not -100 <= sx <= W + 100:
+            return
+        # Dark aura
+        surf.blit(self._AURA, (sx - 82, int(self.y) - 82))
+
+        # Body and eyes
+        sprite = self._SPRITES[self.last_hit <= 0.2]
+        surf.blit(sprite, (sx - 36, int(self.y) - 36))
 
 class Marx(Boss):
+    _RECT_SIZE = (70, 70)
+    _SPRITES = None
+    # Wing vertices as (dx, dy, flap) local offsets; flap scales the
+    # per-frame wing_offset so draw() only adds, no trig per vertex
+    _WING_L = ((-25, 0, 0), (-60, -20, -1), (-55, 20, -1))
+    _WING_R = ((25, 0, 0), (60, -20, 1), (55, 20, 1))
+
     def __init__(self, x):
         super().__init__(x, FLOOR_Y - 80, 35)
         self.wings_angle = 0
         self.teleport_cooldown = 0
         self.attack_pattern = 0
-    
+        if Marx._SPRITES is None:
+            base = self._build_sprite()
+            Marx._SPRITES = (base, self._white_flash(base))
+
+    @staticmethod
+    def _build_sprite():
+        # Anchor: blit at (sx - 31, y - 48); the flapping wings animate
+        # so they stay dynamic draws underneath.
+        s = pygame.Surface((62, 80), pygame.SRCALPHA)
+        # Body
+        pygame.draw.circle(s, (150, 0, 150), (31, 48), 30)
+        # Hat
+        pygame.draw.polygon(s, (255, 0, 255), [(11, 23), (51, 23), (31, 3)])
+        # Face
+        pygame.draw.circle(s, BLACK, (21, 43), 5)
+        pygame.draw.circle(s, BLACK, (41, 43), 5)
+        pygame.draw.arc(s, BLACK, (16, 48, 30, 20), 0, math.pi, 2)
+        return s
+
     def rect(self):
-        return pygame.Rect(int(self.x - 35), int(self.y - 35), 70, 70)
+        self._rect.topleft = (int(self.x - 35), int(self.y - 35))
+        return self._rect
     
     def update(self, dt, player):
         self.last_hit += dt
         self.attack_timer += dt
         self.wings_angle += dt * 3
         self.teleport_cooldown = max(0, self.teleport_cooldown - dt)
-        
+
+        # Far off-camera: keep the timers ticking but skip attacks and
+        # movement until the player gets close
+        if abs(self.x - game.camera_x - W / 2) > W * 1.5:
+            return
+
         # Float and move
-        self.y = FLOOR_Y - 80 + math.sin(self.wings_angle) * 20
+        self.y = FLOOR_Y - 80 + fsin(self.wings_angle) * 20
         
         # Teleport occasionally
         if self.teleport_cooldown <= 0 and random.random() < 0.01:
@@ -969,257 +1178,267 @@ class Marx(Boss):
             
             if self.attack_pattern == 0:
                 # Spread shot
-                for angle in range(-60, 61, 30):
-                    rad = math.radians(angle)
-                    projectiles.append(Projectile(
-                        self.x,
-                        self.y,
-                        math.sin(rad) * 250,
-                        math.cos(rad) * 250 + 100,
-                        2, Ability.BEAM, "boss"
-                    ))
+                rads = np.radians(np.arange(-60, 61, 30))
+                projectiles.spawn_batch(
+                    np.full(rads.size, self.x), np.full(rads.size, self.y),
+                    np.sin(rads) * 250,
+                    np.cos(rads) * 250 + 100,
+                    2, Ability.BEAM, "boss"
+                )
             elif self.attack_pattern == 1:
                 # Laser beams
-                for i in range(4):
-                    projectiles.append(Projectile(
-                        self.x + (i - 1.5) * 40,
-                        self.y,
-                        0,
-                        400,
-                        3, Ability.SPARK, "boss"
-                    ))
+                projectiles.spawn_batch(
+                    self.x + (np.arange(4) - 1.5) * 40, np.full(4, self.y),
+                    np.zeros(4), np.full(4, 400.0),
+                    3, Ability.SPARK, "boss"
+                )
             else:
                 # Bouncing balls
-                for i in range(2):
-                    projectiles.append(Projectile(
-                        self.x,
-                        self.y,
-                        random.choice([-200, 200]),
-                        -300,
-                        2, Ability.FIRE, "boss"
-                    ))
+                projectiles.spawn_batch(
+                    np.full(2, self.x), np.full(2, self.y),
+                    RNG.choice((-200.0, 200.0), 2), np.full(2, -300.0),
+                    2, Ability.FIRE, "boss"
+                )
     
     def draw(self, surf, camx):
         sx = int(self.x - camx)
-        if -100 <= sx <= W + 100:
-            # Wings
-            wing_offset = abs(math.sin(self.wings_angle)) * 30
-            wing_color = (200, 0, 200) if self.last_hit > 0.2 else WHITE
-            
-            # Left wing
-            pygame.draw.polygon(surf, wing_color, [
-                (sx - 25, int(self.y)),
-                (sx - 60 - wing_offset, int(self.y) - 20),
-                (sx - 55 - wing_offset, int(self.y) + 20)
-            ])
-            # Right wing  
-            pygame.draw.polygon(surf, wing_color, [
-                (sx + 25, int(self.y)),
-                (sx + 60 + wing_offset, int(self.y) - 20),
-                (sx + 55 + wing_offset, int(self.y) + 20)
-            ])
-            
-            # Body
-            body_color = (150, 0, 150) if self.last_hit > 0.2 else WHITE
-            pygame.draw.circle(surf, body_color, (sx, int(self.y)), 30)
-            
-            # Hat
-            pygame.draw.polygon(surf, (255, 0, 255), [
-                (sx - 20, int(self.y) - 25),
-                (sx + 20, int(self.y) - 25),
-                (sx, int(self.y) - 45)
-            ])
-            
-            # Face
-            pygame.draw.circle(surf, BLACK, (sx - 10, int(self.y) - 5), 5)
-            pygame.draw.circle(surf, BLACK, (sx + 10, int(self.y) - 5), 5)
-            pygame.draw.arc(surf, BLACK, 
-                           (sx - 15, int(self.y), 30, 20), 0, math.pi, 2)
+        if not -100 <= sx <= W + 100:
+            return
+        # Wings
+        wing_offset = abs(fsin(self.wings_angle)) * 30
+        wing_color = (200, 0, 200) if self.last_hit > 0.2 else WHITE
+        sy = int(self.y)
+        pygame.draw.polygon(surf, wing_color, [
+            (sx + dx + flap * wing_offset, sy + dy)
+            for dx, dy, flap in self._WING_L
+        ])
+        pygame.draw.polygon(surf, wing_color, [
+            (sx + dx + flap * wing_offset, sy + dy)
+            for dx, dy, flap in self._WING_R
+        ])
+
+        # Body, hat and face
+        sprite = self._SPRITES[self.last_hit <= 0.2]
+        surf.blit(sprite, (sx - 31, int(self.y) - 48))
 
 class ZeroTwo(Boss):
+    _RECT_SIZE = (120, 120)
+    _SPRITES = None  # keyed (phase, hit-flash)
+    _HALO = None
+    # Static local-space geometry for the phase-2 extras: the six thorn
+    # endpoints and the wing polygons never change shape
+    _THORN_DIRS = tuple(
+        (int(math.cos(i * math.pi / 3) * 70), int(math.sin(i * math.pi / 3) * 70))
+        for i in range(6)
+    )
+    _WING_L = ((-40, 0), (-100, -40), (-90, 40))
+    _WING_R = ((40, 0), (100, -40), (90, 40))
+
     def __init__(self, x):
         super().__init__(x, FLOOR_Y - 120, 50)
         self.eye_angle = 0
         self.blood_timer = 0
         self.phase = 1
-    
+        if ZeroTwo._SPRITES is None:
+            ZeroTwo._SPRITES = {
+                (phase, flash): self._build_sprite(phase, flash)
+                for phase in (1, 2) for flash in (False, True)
+            }
+            ZeroTwo._HALO = self._build_halo()
+
+    @staticmethod
+    def _build_halo():
+        # Phase-1 halo ring, rasterized once.
+        # Anchor: blit at (sx - 33, y - 103)
+        s = pygame.Surface((66, 66), pygame.SRCALPHA)
+        pygame.draw.circle(s, (255, 255, 100), (33, 33), 30, 3)
+        return s
+
+    @staticmethod
+    def _build_sprite(phase, flash):
+        # Anchor: blit at (sx - 56, y - 56); the pupil tracks eye_angle
+        # so it stays a dynamic draw on top.
+        s = pygame.Surface((112, 112), pygame.SRCALPHA)
+        body_color = (255, 100, 100) if flash else WHITE
+        iris_color = (0, 200, 0) if phase == 1 else (200, 0, 0)
+        # Main eye body
+        pygame.draw.circle(s, body_color, (56, 56), 55)
+        # Iris
+        pygame.draw.circle(s, iris_color, (56, 56), 35)
+        return s
+
     def rect(self):
-        return pygame.Rect(int(self.x - 60), int(self.y - 60), 120, 120)
+        self._rect.topleft = (int(self.x - 60), int(self.y - 60))
+        return self._rect
     
     def update(self, dt, player):
         self.last_hit += dt
         self.attack_timer += dt
         self.blood_timer += dt
         self.eye_angle += dt
-        
+
+        # Far off-camera: keep the timers ticking but skip attacks and
+        # movement until the player gets close
+        if abs(self.x - game.camera_x - W / 2) > W * 1.5:
+            return
+
         # Phase change
         if self.hp < self.max_hp // 2 and self.phase == 1:
             self.phase = 2
             create_explosion(self.x, self.y, (255, 0, 0), 30)
         
-        # Floating movement
-        self.y = FLOOR_Y - 120 + math.sin(self.eye_angle * 0.5) * 40
-        self.x += math.sin(self.eye_angle * 0.3) * 100 * dt
+        # Floating movement (bind the repeated lookups once)
+        _sin = fsin
+        self.y = FLOOR_Y - 120 + _sin(self.eye_angle * 0.5) * 40
+        self.x += _sin(self.eye_angle * 0.3) * 100 * dt
         self.x = max(150, min(LEVEL_LEN - 150, self.x))
-        
+
         # Blood tears (phase 2)
         if self.phase == 2 and self.blood_timer > 0.5:
             self.blood_timer = 0
-            projectiles.append(Projectile(
-                self.x + random.randint(-20, 20),
+            randint = random.randint
+            projectiles.spawn(
+                self.x + randint(-20, 20),
                 self.y + 30,
-                random.randint(-50, 50),
+                randint(-50, 50),
                 200,
                 3, Ability.NONE, "boss"
-            ))
+            )
         
         # Crystal shards attack
         if self.attack_timer > 2.5:
             self.attack_timer = 0
             if self.phase == 1:
                 # Normal pattern
-                for i in range(8):
-                    angle = i * math.pi / 4 + self.eye_angle
-                    projectiles.append(Projectile(
-                        self.x + math.cos(angle) * 60,
-                        self.y + math.sin(angle) * 60,
-                        math.cos(angle) * 250,
-                        math.sin(angle) * 250,
-                        2, Ability.ICE, "boss"
-                    ))
+                angles = np.arange(8) * (math.pi / 4) + self.eye_angle
+                cos_a, sin_a = np.cos(angles), np.sin(angles)
+                projectiles.spawn_batch(
+                    self.x + cos_a * 60, self.y + sin_a * 60,
+                    cos_a * 250, sin_a * 250,
+                    2, Ability.ICE, "boss"
+                )
             else:
                 # Chaotic pattern
-                for i in range(12):
-                    angle = random.uniform(0, math.pi * 2)
-                    speed = random.uniform(150, 350)
-                    projectiles.append(Projectile(
-                        self.x,
-                        self.y,
-                        math.cos(angle) * speed,
-                        math.sin(angle) * speed,
-                        3, Ability.BEAM, "boss"
-                    ))
+                angles = RNG.uniform(0, math.pi * 2, 12)
+                speeds = RNG.uniform(150, 350, 12)
+                projectiles.spawn_batch(
+                    np.full(12, self.x), np.full(12, self.y),
+                    np.cos(angles) * speeds, np.sin(angles) * speeds,
+                    3, Ability.BEAM, "boss"
+                )
     
     def draw(self, surf, camx):
         sx = int(self.x - camx)
-        if -150 <= sx <= W + 150:
-            # Wings (phase 2)
-            if self.phase == 2:
-                wing_color = (100, 0, 0)
-                # Left wing
-                pygame.draw.polygon(surf, wing_color, [
-                    (sx - 40, int(self.y)),
-                    (sx - 100, int(self.y) - 40),
-                    (sx - 90, int(self.y) + 40)
-                ])
-                # Right wing
-                pygame.draw.polygon(surf, wing_color, [
-                    (sx + 40, int(self.y)),
-                    (sx + 100, int(self.y) - 40),
-                    (sx + 90, int(self.y) + 40)
-                ])
-            
-            # Main eye body
-            body_color = WHITE if self.last_hit > 0.2 else (255, 100, 100)
-            pygame.draw.circle(surf, body_color, (sx, int(self.y)), 55)
-            
-            # Iris
-            iris_color = (0, 200, 0) if self.phase == 1 else (200, 0, 0)
-            pygame.draw.circle(surf, iris_color, (sx, int(self.y)), 35)
-            
-            # Pupil
-            pupil_x = sx + math.cos(self.eye_angle) * 10
-            pupil_y = int(self.y) + math.sin(self.eye_angle) * 10
-            pygame.draw.circle(surf, BLACK, (int(pupil_x), int(pupil_y)), 15)
-            
-            # Blood tears (phase 2)
-            if self.phase == 2:
-                pygame.draw.line(surf, (150, 0, 0), 
-                               (sx - 20, int(self.y) + 30),
-                               (sx - 25, int(self.y) + 60), 3)
-                pygame.draw.line(surf, (150, 0, 0), 
-                               (sx + 20, int(self.y) + 30),
-                               (sx + 25, int(self.y) + 60), 3)
-            
-            # Halo (phase 1) or thorns (phase 2)
-            if self.phase == 1:
-                pygame.draw.circle(surf, (255, 255, 100), 
-                                 (sx, int(self.y) - 70), 30, 3)
-            else:
-                for i in range(6):
-                    angle = i * math.pi / 3
-                    thorn_x = sx + math.cos(angle) * 70
-                    thorn_y = int(self.y) + math.sin(angle) * 70
-                    pygame.draw.line(surf, (100, 0, 0),
-                                   (sx, int(self.y)),
-                                   (int(thorn_x), int(thorn_y)), 3)
+        if not -150 <= sx <= W + 150:
+            return
+        # Wings (phase 2)
+        if self.phase == 2:
+            wing_color = (100, 0, 0)
+            sy = int(self.y)
+            pygame.draw.polygon(surf, wing_color,
+                                [(sx + dx, sy + dy) for dx, dy in self._WING_L])
+            pygame.draw.polygon(surf, wing_color,
+                                [(sx + dx, sy + dy) for dx, dy in self._WING_R])
+
+        # Main eye body and iris
+        sprite = self._SPRITES[(self.phase, self.last_hit <= 0.2)]
+        surf.blit(sprite, (sx - 56, int(self.y) - 56))
+
+        # Pupil
+        pupil_x = sx + fcos(self.eye_angle) * 10
+        pupil_y = int(self.y) + fsin(self.eye_angle) * 10
+        pygame.draw.circle(surf, BLACK, (int(pupil_x), int(pupil_y)), 15)
+
+        # Blood tears (phase 2)
+        if self.phase == 2:
+            pygame.draw.line(surf, (150, 0, 0), 
+                           (sx - 20, int(self.y) + 30),
+                           (sx - 25, int(self.y) + 60), 3)
+            pygame.draw.line(surf, (150, 0, 0), 
+                           (sx + 20, int(self.y) + 30),
+                           (sx + 25, int(self.y) + 60), 3)
+
+        # Halo (phase 1) or thorns (phase 2)
+        if self.phase == 1:
+            surf.blit(self._HALO, (sx - 33, int(self.y) - 103))
+        else:
+            sy = int(self.y)
+            for dx, dy in self._THORN_DIRS:
+                pygame.draw.line(surf, (100, 0, 0),
+                               (sx, sy), (sx + dx, sy + dy), 3)
 
 # ============================================================
 # Level System
 # ============================================================
-LEVEL_DATA = {
-    1: {
-        "name": "Green Greens",
-        "enemies": [
-            (WaddleDee, [300, 500, 700, 900]),
-            (FireEnemy, [400, 800]),
-        ],
-        "boss": WhispyWoods,
-        "bg_color": SKY_GRADIENT_TOP
-    },
-    2: {
-        "name": "Castle Dedede",
-        "enemies": [
-            (WaddleDee, [350, 550, 750]),
-            (SwordKnight, [450, 850]),
-            (IceEnemy, [600]),
-        ],
-        "boss": KingDedede,
-        "bg_color": (100, 100, 150)
-    },
-    3: {
-        "name": "Orange Ocean",
-        "enemies": [
-            (FireEnemy, [400, 700, 1000]),
-            (SparkEnemy, [500, 900]),
-            (WaddleDee, [600, 800]),
-        ],
-        "boss": MetaKnight,
-        "bg_color": (255, 150, 100)
-    },
-    4: {
-        "name": "Nightmare Land",
-        "enemies": [
-            (SparkEnemy, [400, 600, 800]),
-            (IceEnemy, [500, 700, 900]),
-            (SwordKnight, [550, 750]),
-        ],
-        "boss": NightmareWizard,
-        "bg_color": (50, 0, 100)
-    },
-    5: {
-        "name": "Milky Way Wishes",
-        "enemies": [
-            (FireEnemy, [400, 600]),
-            (SparkEnemy, [500, 700]),
-            (IceEnemy, [450, 650]),
-            (SwordKnight, [550, 750]),
-        ],
-        "boss": Marx,
-        "bg_color": (20, 0, 50)
-    },
-    6: {
-        "name": "Dark Star",
-        "enemies": [
-            (SparkEnemy, [400, 600, 800, 1000]),
-            (FireEnemy, [500, 700, 900]),
-            (IceEnemy, [450, 650, 850]),
-            (SwordKnight, [550, 750, 950]),
-        ],
-        "boss": ZeroTwo,
-        "bg_color": (0, 0, 0)
-    }
-}
+LevelInfo = namedtuple("LevelInfo", "name enemies boss bg_color")
+
+# Indexed by level number (slot 0 unused) — plain tuple indexing and
+# attribute access, no dict hashing in the per-frame lookups
+LEVEL_TABLE = (
+    None,
+    LevelInfo(
+        name="Green Greens",
+        enemies=(
+            (WaddleDee, (300, 500, 700, 900)),
+            (FireEnemy, (400, 800)),
+        ),
+        boss=WhispyWoods,
+        bg_color=SKY_GRADIENT_TOP,
+    ),
+    LevelInfo(
+        name="Castle Dedede",
+        enemies=(
+            (WaddleDee, (350, 550, 750)),
+            (SwordKnight, (450, 850)),
+            (IceEnemy, (600,)),
+        ),
+        boss=KingDedede,
+        bg_color=(100, 100, 150),
+    ),
+    LevelInfo(
+        name="Orange Ocean",
+        enemies=(
+            (FireEnemy, (400, 700, 1000)),
+            (SparkEnemy, (500, 900)),
+            (WaddleDee, (600, 800)),
+        ),
+        boss=MetaKnight,
+        bg_color=(255, 150, 100),
+    ),
+    LevelInfo(
+        name="Nightmare Land",
+        enemies=(
+            (SparkEnemy, (400, 600, 800)),
+            (IceEnemy, (500, 700, 900)),
+            (SwordKnight, (550, 750)),
+        ),
+        boss=NightmareWizard,
+        bg_color=(50, 0, 100),
+    ),
+    LevelInfo(
+        name="Milky Way Wishes",
+        enemies=(
+            (FireEnemy, (400, 600)),
+            (SparkEnemy, (500, 700)),
+            (IceEnemy, (450, 650)),
+            (SwordKnight, (550, 750)),
+        ),
+        boss=Marx,
+        bg_color=(20, 0, 50),
+    ),
+    LevelInfo(
+        name="Dark Star",
+        enemies=(
+            (SparkEnemy, (400, 600, 800, 1000)),
+            (FireEnemy, (500, 700, 900)),
+            (IceEnemy, (450, 650, 850)),
+            (SwordKnight, (550, 750, 950)),
+        ),
+        boss=ZeroTwo,
+        bg_color=(0, 0, 0),
+    ),
+)
+NUM_LEVELS = len(LEVEL_TABLE) - 1
 
 # ============================================================
 # Game State
@@ -1241,36 +1460,51 @@ class GameState:
         self.player = Kirby()
         self.enemies = []
         
-        level_info = LEVEL_DATA.get(level_num, LEVEL_DATA[1])
-        
+        level_info = (LEVEL_TABLE[level_num]
+                      if 1 <= level_num <= NUM_LEVELS else LEVEL_TABLE[1])
+
         # Spawn enemies
-        for enemy_class, positions in level_info["enemies"]:
+        for enemy_class, positions in level_info.enemies:
             for pos in positions:
                 self.enemies.append(enemy_class(pos))
-        
+
         # Spawn boss
-        boss_class = level_info["boss"]
-        self.boss = boss_class(LEVEL_LEN - 300)
+        self.boss = level_info.boss(LEVEL_LEN - 300)
         
         self.camera_x = 0
         
         # Clear projectiles and particles for new level
-        global projectiles, particles
-        projectiles = []
+        global particles
+        projectiles.clear()
         particles = []
 
+        # Drop gradients from the previous level
+        _gradient_cache.clear()
+
 game = GameState()
 
 # ============================================================
 # Drawing Functions
 # ============================================================
+# Gradients never change within a level, so render each (top, bottom) pair
+# once and blit the cached Surface from then on.
+_gradient_cache = {}
+
 def draw_gradient_bg(surf, color1, color2):
-    for y in range(H):
-        ratio = y / H
-        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-        pygame.draw.line(surf, (r, g, b), (0, y), (W, y))
+    key = (color1, color2)
+    cached = _gradient_cache.get(key)
+    if cached is None:
+        # Build the whole ramp in NumPy: one row of interpolated colors
+        # broadcast across the width, then a single surfarray copy
+        cached = pygame.Surface((W, H))
+        t = np.linspace(0, 1, H, endpoint=False, dtype=np.float32)[:, None]
+        c1 = np.asarray(color1, np.float32)
+        c2 = np.asarray(color2, np.float32)
+        rows = ((1 - t) * c1 + t * c2).astype(np.uint8)
+        rgb = np.broadcast_to(rows[:, None, :], (H, W, 3))
+        pygame.surfarray.blit_array(cached, rgb.swapaxes(0, 1).copy())
+        _gradient_cache[key] = cached
+    surf.blit(cached, (0, 0))
 
 def draw_kirby_face(surf, x, y, size=15):
     """Draw a small Kirby face for the lives display"""
@@ -1300,37 +1534,96 @@ def draw_star(surf, x, y, size=10, color=STAR_YELLOW):
         points.append((px, py))
     pygame.draw.polygon(surf, color, points)
 
+# The HUD star never moves or changes size, so rasterize it once here
+# (draw_star stays available for runtime-varying stars)
+_STAR_SURF = pygame.Surface((22, 22), pygame.SRCALPHA)
+draw_star(_STAR_SURF, 11, 11, 8)
+
+# Static HUD labels, rendered once at import
+_LIVES_LABEL = font.render("LIVES", True, WHITE)
+_STARS_LABEL = font.render("STARS", True, WHITE)
+_HP_LABEL = font.render("HP", True, WHITE)
+
+@functools.lru_cache(maxsize=256)
+def _render_cached(text, color=WHITE):
+    """Memoized font.render for HUD strings that rarely change frame to
+    frame (score, star count, boss HP)."""
+    return font.render(text, True, color)
+
+def _build_hud_static():
+    # Everything in the HUD that never changes — translucent panel,
+    # border, labels, star icon — composited once into a single surface
+    s = pygame.Surface((W, 60), pygame.SRCALPHA)
+    s.fill((0, 0, 50, 200))
+    pygame.draw.rect(s, WHITE, (0, 0, W, 60), 2)
+    s.blit(_LIVES_LABEL, (10, 35))
+    s.blit(_STARS_LABEL, (200, 10))
+    s.blit(_STAR_SURF, (239, 7))
+    return s
+
+_HUD_STATIC = _build_hud_static()
+
+def _build_ability_icon(ability):
+    # Pre-render the 100x40 ability badge (background box plus the
+    # per-ability shape) so draw_hud can blit it instead of redrawing
+    # the primitives every frame. Shapes are the on-screen coords
+    # shifted by the badge's (350, 10) HUD position.
+    s = pygame.Surface((100, 40), pygame.SRCALPHA)
+    s.fill(BLACK)
+    pygame.draw.rect(s, ABILITY_COLORS[ability], (0, 0, 100, 40), 2)
+    if ability == Ability.FIRE:
+        pygame.draw.polygon(s, FIRE_ORANGE, [(50, 10), (40, 25), (60, 25)])
+    elif ability == Ability.ICE:
+        pygame.draw.polygon(s, ICE_BLUE, [
+            (50, 5), (45, 15), (45, 25), (55, 25), (55, 15)])
+    elif ability == Ability.SPARK:
+        pygame.draw.circle(s, SPARK_YELLOW, (50, 20), 8)
+        for i in range(4):
+            angle = i * math.pi / 2
+            pygame.draw.line(s, WHITE, (50, 20),
+                             (50 + math.cos(angle) * 12,
+                              20 + math.sin(angle) * 12), 2)
+    elif ability == Ability.STONE:
+        pygame.draw.rect(s, STONE_GRAY, (45, 10, 10, 20))
+    elif ability == Ability.SWORD:
+        pygame.draw.rect(s, SWORD_SILVER, (48, 5, 4, 25))
+        pygame.draw.rect(s, (100, 100, 100), (45, 0, 10, 8))
+    elif ability == Ability.BEAM:
+        for i in range(3):
+            pygame.draw.circle(s, BEAM_PURPLE, (40 + i * 5, 20 - i * 3), 3)
+    elif ability == Ability.TORNADO:
+        for i in range(3):
+            pygame.draw.arc(s, TORNADO_GREEN,
+                            (40 + i * 3, 10 + i * 3, 20 - i * 3, 20 - i * 3),
+                            0, math.pi, 2)
+    return s
+
+_ABILITY_ICONS = {a: _build_ability_icon(a) for a in Ability
+                  if a != Ability.NONE}
+
+# Reused full-screen dimmer for the pause state — allocating and
+# zero-filling a fresh W x H surface every paused frame is wasted work
+_DIM_OVERLAY = pygame.Surface((W, H))
+_DIM_OVERLAY.set_alpha(128)
+_DIM_OVERLAY.fill(BLACK)
+
 def draw_hud(surf):
-    # Draw HUD background panel
-    hud_bg = pygame.Surface((W, 60))
-    hud_bg.set_alpha(200)
-    hud_bg.fill((0, 0, 50))
-    surf.blit(hud_bg, (0, 0))
-    
-    # Draw border
-    pygame.draw.rect(surf, WHITE, (0, 0, W, 60), 2)
-    
+    # Panel, border, labels and star icon in one pre-composited blit
+    surf.blit(_HUD_STATIC, (0, 0))
+
     # Score
-    score_text = font.render(f"SCORE {game.score:06d}", True, WHITE)
-    surf.blit(score_text, (10, 10))
-    
+    surf.blit(_render_cached(f"SCORE {game.score:06d}"), (10, 10))
+
     # Lives as Kirby faces
-    lives_text = font.render("LIVES", True, WHITE)
-    surf.blit(lives_text, (10, 35))
     for i in range(game.lives):
         draw_kirby_face(surf, 70 + i * 35, 43, 12)
-    
+
     # Star counter
-    stars_text = font.render("STARS", True, WHITE)
-    surf.blit(stars_text, (200, 10))
-    draw_star(surf, 250, 18, 8)
-    stars_count_text = font.render(f"X {game.score // 100}", True, WHITE)
-    surf.blit(stars_count_text, (265, 10))
+    surf.blit(_render_cached(f"X {game.score // 100}"), (265, 10))
     
     # HP bar (only show if not at max HP)
     if game.player.hp < game.player.max_hp:
-        hp_text = font.render("HP", True, WHITE)
-        surf.blit(hp_text, (200, 35))
+        surf.blit(_HP_LABEL, (200, 35))
         hp_width = 80
         hp_height = 10
         hp_x = 230
@@ -1340,61 +1633,10 @@ def draw_hud(surf):
         hp_fill = int((game.player.hp / game.player.max_hp) * hp_width)
         pygame.draw.rect(surf, KIRBY_PINK, (hp_x, hp_y, hp_fill, hp_height))
     
-    # Ability icon with background
+    # Ability icon with background (pre-rendered per ability)
     if game.player.ability != Ability.NONE:
-        ability_name = game.player.ability.name
-        ability_color = ABILITY_COLORS[game.player.ability]
-        
-        # Draw ability icon background
-        pygame.draw.rect(surf, BLACK, (350, 10, 100, 40))
-        pygame.draw.rect(surf, ability_color, (350, 10, 100, 40), 2)
-        
-        # Draw ability icon
-        if game.player.ability == Ability.FIRE:
-            # Fire icon
-            pygame.draw.polygon(surf, FIRE_ORANGE, [
-                (400, 20),
-                (390, 35),
-                (410, 35)
-            ])
-        elif game.player.ability == Ability.ICE:
-            # Ice icon
-            pygame.draw.polygon(surf, ICE_BLUE, [
-                (400, 15),
-                (395, 25),
-                (395, 35),
-                (405, 35),
-                (405, 25)
-            ])
-        elif game.player.ability == Ability.SPARK:
-            # Spark icon
-            pygame.draw.circle(surf, SPARK_YELLOW, (400, 30), 8)
-            for i in range(4):
-                angle = i * math.pi / 2
-                pygame.draw.line(surf, WHITE, 
-                               (400, 30),
-                               (400 + math.cos(angle) * 12, 30 + math.sin(angle) * 12), 2)
-        elif game.player.ability == Ability.STONE:
-            # Stone icon
-            pygame.draw.rect(surf, STONE_GRAY, (395, 20, 10, 20))
-        elif game.player.ability == Ability.SWORD:
-            # Sword icon
-            pygame.draw.rect(surf, SWORD_SILVER, (398, 15, 4, 25))
-            pygame.draw.rect(surf, (100, 100, 100), (395, 10, 10, 8))
-        elif game.player.ability == Ability.BEAM:
-            # Beam icon
-            for i in range(3):
-                pygame.draw.circle(surf, BEAM_PURPLE, (390 + i*5, 30 - i*3), 3)
-        elif game.player.ability == Ability.TORNADO:
-            # Tornado icon
-            for i in range(3):
-                pygame.draw.arc(surf, TORNADO_GREEN, 
-                              (390 + i*3, 20 + i*3, 20 - i*3, 20 - i*3), 
-                              0, math.pi, 2)
-        
-        # Ability name
-        ability_text = font.render(ability_name, True, WHITE)
-        surf.blit(ability_text, (360, 35))
+        surf.blit(_ABILITY_ICONS[game.player.ability], (350, 10))
+        surf.blit(_render_cached(game.player.ability.name), (360, 35))
     
     # Boss HP
     if game.boss and game.boss.hp > 0:
@@ -1402,10 +1644,8 @@ def draw_hud(surf):
         boss_hp_x = W - boss_hp_width - 10
         boss_hp_y = 20
         
-        # Boss name
-        boss_name = game.boss.__class__.__name__
-        name_text = font.render(boss_name, True, WHITE)
-        surf.blit(name_text, (boss_hp_x, boss_hp_y - 15))
+        # Boss name (rendered once in Boss.__init__)
+        surf.blit(game.boss.name_surface, (boss_hp_x, boss_hp_y - 15))
         
         # HP bar background
         pygame.draw.rect(surf, BLACK, 
@@ -1421,15 +1661,15 @@ def draw_hud(surf):
                         (boss_hp_x, boss_hp_y, hp_fill, 10))
         
         # HP text
-        hp_text = font.render(f"{game.boss.hp}/{game.boss.max_hp}", True, WHITE)
+        hp_text = _render_cached(f"{game.boss.hp}/{game.boss.max_hp}")
         surf.blit(hp_text, (boss_hp_x + boss_hp_width // 2 - 20, boss_hp_y - 2))
 
 # ============================================================
 # Main Game Loop
 # ============================================================
 async def main():
-    global particles, projectiles
-    
+    global particles
+
     running = True
     dt = 0
     
@@ -1553,47 +1793,48 @@ async def main():
                         sounds["win"].play()
                     
                     # Next level or victory
-                    if game.level >= len(LEVEL_DATA):
+                    if game.level >= NUM_LEVELS:
                         game.state = "victory"
                     else:
                         game.level += 1
                         game.setup_level(game.level)
             
-            # Update projectiles
-            for proj in projectiles[:]:
-                proj.update(dt)
-                if proj.dead:
-                    projectiles.remove(proj)
-                    continue
-                
-                # Player projectiles hit enemies
-                if proj.owner == "player":
-                    for enemy in game.enemies:
-                        if not enemy.dead and enemy.rect().colliderect(proj.rect()):
-                            enemy.take_damage(proj.damage)
-                            if enemy.dead:
-                                game.score += 200
-                            proj.dead = True
-                            create_explosion(proj.x, proj.y, 
-                                          ABILITY_COLORS.get(proj.ability, WHITE), 8)
-                            break
-                    
-                    # Hit boss
-                    if game.boss and game.boss.hp > 0:
-                        if game.boss.rect().colliderect(proj.rect()):
-                            game.boss.take_damage(proj.damage)
-                            game.score += 100
-                            proj.dead = True
-                            create_explosion(proj.x, proj.y, 
-                                          ABILITY_COLORS.get(proj.ability, WHITE), 12)
-                
-                # Enemy projectiles hit player
-                elif proj.owner == "boss":
-                    if game.player.rect().colliderect(proj.rect()):
-                        game.player.take_damage()
-                        proj.dead = True
-                        create_explosion(proj.x, proj.y, WHITE, 8)
-            
+            # Update projectiles (one vectorized pass over the pool)
+            projectiles.update(dt)
+
+            # Player projectiles hit enemies
+            for slot in projectiles.active(OWNER_PLAYER):
+                proj_rect = projectiles.rect(slot)
+                for enemy in game.enemies:
+                    if enemy.dead or not enemy.rect().colliderect(proj_rect):
+                        continue
+                    enemy.take_damage(int(projectiles.damage[slot]))
+                    if enemy.dead:
+                        game.score += 200
+                    projectiles.alive[slot] = False
+                    create_explosion(projectiles.x[slot], projectiles.y[slot],
+                                  ABILITY_COLORS.get(Ability(projectiles.ability[slot]), WHITE), 8)
+                    break
+
+            # Player projectiles hit boss
+            if game.boss and game.boss.hp > 0:
+                boss_rect = game.boss.rect()
+                for slot in projectiles.active(OWNER_PLAYER):
+                    if boss_rect.colliderect(projectiles.rect(slot)):
+                        game.boss.take_damage(int(projectiles.damage[slot]))
+                        game.score += 100
+                        projectiles.alive[slot] = False
+                        create_explosion(projectiles.x[slot], projectiles.y[slot],
+                                      ABILITY_COLORS.get(Ability(projectiles.ability[slot]), WHITE), 12)
+
+            # Enemy projectiles hit player
+            player_rect = game.player.rect()
+            for slot in projectiles.active(OWNER_BOSS):
+                if player_rect.colliderect(projectiles.rect(slot)):
+                    game.player.take_damage()
+                    projectiles.alive[slot] = False
+                    create_explosion(projectiles.x[slot], projectiles.y[slot], WHITE, 8)
+
             # Update particles
             for particle in particles[:]:
                 if not particle.update(dt):
@@ -1609,8 +1850,9 @@ async def main():
                     game.setup_level(game.level)
             
             # Draw everything
-            level_info = LEVEL_DATA.get(game.level, LEVEL_DATA[1])
-            draw_gradient_bg(screen, level_info["bg_color"], GRASS_GREEN)
+            level_info = (LEVEL_TABLE[game.level]
+                          if 1 <= game.level <= NUM_LEVELS else LEVEL_TABLE[1])
+            draw_gradient_bg(screen, level_info.bg_color, GRASS_GREEN)
             
             # Ground
             pygame.draw.rect(screen, GRASS_GREEN, 
@@ -1634,8 +1876,7 @@ async def main():
             if game.boss:
                 game.boss.draw(screen, game.camera_x)
             
-            for proj in projectiles:
-                proj.draw(screen, game.camera_x)
+            projectiles.draw(screen, game.camera_x)
             
             for particle in particles:
                 particle.draw(screen, game.camera_x)
@@ -1644,7 +1885,7 @@ async def main():
             draw_hud(screen)
             
             # Level name
-            level_name = level_info["name"]
+            level_name = level_info.name
             level_text = big_font.render(level_name, True, WHITE)
             level_rect = level_text.get_rect(center=(W//2, 80))
             screen.blit(level_text, level_rect)
@@ -1656,10 +1897,7 @@ async def main():
         # Paused
         elif game.state == "paused":
             # Darken screen
-            overlay = pygame.Surface((W, H))
-            overlay.set_alpha(128)
-            overlay.fill(BLACK)
-            screen.blit(overlay, (0, 0))
+            screen.blit(_DIM_OVERLAY, (0, 0))
             
             pause_text = ultra_font.render("PAUSED", True, WHITE)
             pause_rect = pause_text.get_rect(center=(W//2, H//2))